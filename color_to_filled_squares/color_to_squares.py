@@ -1,9 +1,12 @@
 import sys
 import os
 from PIL import Image
-import colorsys
+import numpy as np
 
 # --- Configuration ---
+# Bump whenever a change alters the generated output, so cached results are rebuilt.
+ALGORITHM_VERSION = 2
+
 # Target colors and their corresponding Hues (0-360 degrees) for the quantization step.
 # These hues are used to find the closest match to the input pixel's hue.
 TARGET_COLORS = {
@@ -16,57 +19,136 @@ TARGET_COLORS = {
     "#FF00FF": 300,  # Magenta
 }
 
-def get_closest_color(r, g, b):
+# Output palette: the hue targets above followed by the two luminance fallbacks.
+PALETTE_HEX = list(TARGET_COLORS.keys()) + ["#000000", "#B4B4B4"]
+BLACK_INDEX = len(TARGET_COLORS)
+GRAY_INDEX = BLACK_INDEX + 1
+
+# The same palette as RGB triples, for rendering the preview image.
+PALETTE_RGB = np.array(
+    [[int(h[i:i + 2], 16) for i in (1, 3, 5)] for h in PALETTE_HEX], dtype=np.uint8
+)
+
+TARGET_HUES = np.array(list(TARGET_COLORS.values()), dtype=np.float32)
+
+def classify_rgb_array(arr):
     """
-    Determines the output color based on the input pixel's value (luminance) and hue.
+    Determines the output color of every pixel based on its value (luminance) and hue.
+
+    Args:
+        arr: uint8 numpy array of shape (H, W, 3)
+
+    Returns:
+        (H, W) integer array of indices into PALETTE_HEX
     """
     # 1. Calculate Value (V) for thresholding (using max component for simplicity)
-    V = max(r, g, b)
+    V = arr.max(axis=2)
 
-    # 2. Apply Luminance Threshold Rules
-    if V < 25:
-        return "#000000"  # Black
-    
-    #if (V > 200):
-    #    return "#B4B4B4"  # Light Gray
+    # 2. Convert to HSV on the 0-1 range, following colorsys arithmetic so
+    # threshold and tie cases land exactly where the per-pixel version did
+    rgb = arr / 255.0
+    maxc = rgb.max(axis=2)
+    minc = rgb.min(axis=2)
+    delta = maxc - minc
+    s_float = np.where(maxc > 0, delta / np.where(maxc > 0, maxc, 1), 0)
+    v_float = maxc
 
-    # 3. Apply Hue Matching Rule (between 25 and 200)
-    
-    # Normalize RGB to 0-1 range for colorsys
-    r_norm, g_norm, b_norm = r / 255.0, g / 255.0, b / 255.0
-    
-    # Convert RGB to HSV. colorsys hue is 0-1, so multiply by 360
-    h_float, s_float, v_float = colorsys.rgb_to_hsv(r_norm, g_norm, b_norm)
-    pixel_hue = h_float * 360
-
-    # Ensure the pixel has enough saturation/value to be considered a 'color'
-    # If the pixel is too grayish or dark, the hue is meaningless.
-    # We proceed with hue matching only if saturation/value is decent.
-    if s_float < 0.45 or v_float < 0.15:
-         # If not colorful enough, treat it as a shade of gray based on its value
-         return "#B4B4B4" if v_float > 0.5 else "#000000"
-         
-    
-    min_diff = 360
-    closest_hex = ""
-
-    # Iterate through target hues to find the minimum angular difference
-    for hex_code, target_hue in TARGET_COLORS.items():
-        # Calculate the angular difference, handling the wrap-around at 0/360 degrees
-        diff = abs(pixel_hue - target_hue)
-        
-        # Check the shortest path around the circle (e.g., 350 vs 10 is 20, not 340)
-        angular_diff = min(diff, 360 - diff)
-        
-        if angular_diff < min_diff:
-            min_diff = angular_diff
-            closest_hex = hex_code
-            
-    return closest_hex
+    # Hue with the standard six-sector formula; the channel holding the maximum
+    # picks the sector (ties resolve red, green, blue like colorsys does)
+    safe_delta = np.where(delta > 0, delta, 1)
+    rc = (maxc - rgb[..., 0]) / safe_delta
+    gc = (maxc - rgb[..., 1]) / safe_delta
+    bc = (maxc - rgb[..., 2]) / safe_delta
+    max_channel = rgb.argmax(axis=2)
+    h = np.select(
+        [max_channel == 0, max_channel == 1],
+        [bc - gc, 2.0 + rc - bc],
+        default=4.0 + gc - rc,
+    )
+    pixel_hue = np.where(delta > 0, (h / 6.0) % 1.0, 0.0) * 360
+
+    # 3. Hue Matching Rule: minimum angular difference to each target hue,
+    # handling the wrap-around at 0/360 degrees
+    diff = np.abs(pixel_hue[..., None] - TARGET_HUES)
+    angular_diff = np.minimum(diff, 360 - diff)
+    idx = angular_diff.argmin(axis=2)
+
+    # 4. Pixels that are not colorful enough are treated as a shade of gray
+    # based on their value; very dark pixels are always black.
+    grayish = (s_float < 0.45) | (v_float < 0.15)
+    idx = np.where(grayish, np.where(v_float > 0.5, GRAY_INDEX, BLACK_INDEX), idx)
+    idx = np.where(V < 25, BLACK_INDEX, idx)
+
+    return idx
+
+# Images with at most this many distinct colors are classified once per color
+UNIQUE_COLOR_LIMIT = 4096
+
+def unique_colors(arr, limit=UNIQUE_COLOR_LIMIT):
+    """
+    Find the distinct colors of an image.
+
+    Args:
+        arr: numpy array (H, W, 3) of uint8 RGB values
+        limit: give up when the image has more distinct colors than this
+
+    Returns:
+        Tuple (colors, inverse): colors is an (N, 1, 3) uint8 "image" of the
+        distinct colors and inverse (H, W) gives each pixel's row in it.
+        None if the image has more than limit colors.
+    """
+    rgb = arr.astype(np.uint32)
+    codes = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+    unique_codes, inverse = np.unique(codes.ravel(), return_inverse=True)
+    if len(unique_codes) > limit:
+        return None
+
+    colors = np.stack([unique_codes >> 16, (unique_codes >> 8) & 0xFF, unique_codes & 0xFF],
+                      axis=-1).astype(np.uint8)
+    return colors[:, None, :], inverse.reshape(arr.shape[:2])
+
+def build_svg_rects(color_indices, square_size_mm, overlap_mm):
+    """
+    Builds the SVG <rect> elements for an index map.
+
+    Horizontal runs of same-color pixels within a row are merged into a single
+    wider rectangle. The numeric fields are formatted with np.char.mod and
+    combined with vectorized string concatenation rather than per-rect f-strings.
+
+    Args:
+        color_indices: (H, W) integer array of indices into PALETTE_HEX
+        square_size_mm (float): The size of each square in millimeters.
+        overlap_mm (float): Extra width/height added to each rectangle so that
+            neighbors overlap slightly and leave no hairline gaps.
+
+    Yields:
+        Array of <rect> element strings for each image row, so callers can
+        write rows out as they go instead of holding the whole SVG in memory
+    """
+    height, width = color_indices.shape
+    # Everything after the width attribute depends only on the color
+    tails = np.array([
+        f'" height="{square_size_mm + overlap_mm:.4f}" fill="{color}" />'
+        for color in PALETTE_HEX
+    ])
+
+    for y, row in enumerate(color_indices):
+        # Run boundaries: positions where the color differs from its left neighbor
+        changes = np.flatnonzero(np.diff(row)) + 1
+        starts = np.r_[0, changes]
+        ends = np.r_[changes, width]
+
+        heads = np.char.add(
+            np.char.add('<rect x="', np.char.mod('%.4f', starts * square_size_mm)),
+            f'" y="{y * square_size_mm:.4f}" width="',
+        )
+        widths = np.char.mod('%.4f', (ends - starts) * square_size_mm + overlap_mm)
+        yield np.char.add(np.char.add(heads, widths), tails[row[starts]])
 
 def generate_pixel_svg(input_image_path, output_svg_path, square_size_mm=0.25):
     """
-    Loads an image, processes pixels, and generates an SVG file.
+    Loads an image, processes pixels, and generates an SVG file plus a
+    preview PNG of the quantized colors next to it.
     
     Args:
         input_image_path (str): Path to the source image file.
@@ -90,47 +172,92 @@ def generate_pixel_svg(input_image_path, output_svg_path, square_size_mm=0.25):
     svg_height_mm = height * square_size_mm
     
     # Constants for the SVG output
-    STROKE_WIDTH_MM = 0.01
+    # Squares are fill-only; growing each one by half the old 0.01mm stroke
+    # keeps adjacent squares overlapping so no hairline gaps appear
+    OVERLAP_MM = 0.005
 
     print(f"Processing image: {width}x{height} pixels.")
     print(f"Output SVG size: {svg_width_mm:.2f}mm x {svg_height_mm:.2f}mm.")
     
-    svg_content = []
-
     # 1. SVG Header
-    svg_content.append(f"""<svg width="{svg_width_mm}mm" height="{svg_height_mm}mm" viewBox="0 0 {svg_width_mm} {svg_height_mm}" xmlns="http://www.w3.org/2000/svg">""")
+    svg_header = f"""<svg width="{svg_width_mm}mm" height="{svg_height_mm}mm" viewBox="0 0 {svg_width_mm} {svg_height_mm}" xmlns="http://www.w3.org/2000/svg">"""
     
     # 2. Generate Rectangles
-    # Iterate over all pixels
-    for y in range(height):
-        for x in range(width):
-            # Get RGB tuple for the current pixel
-            r, g, b = img.getpixel((x, y))
-            
-            # Determine the color based on the rules
-            color = get_closest_color(r, g, b)
-            
-            # Calculate the position of the square in millimeters
-            x_mm = x * square_size_mm
-            y_mm = y * square_size_mm
-            
-            # Generate the SVG <rect> element
-            rect = (
-                f'<rect x="{x_mm:.4f}" y="{y_mm:.4f}" width="{square_size_mm:.4f}" height="{square_size_mm:.4f}" '
-                f'fill="{color}" stroke="{color}" stroke-width="{STROKE_WIDTH_MM:.4f}" />'
-            )
-            svg_content.append(rect)
-            
-    # 3. SVG Footer
-    svg_content.append("</svg>")
-    
-    # Write the content to the file
+    # Classify the whole image at once (or just its distinct colors when
+    # there are few), then emit one rectangle per color run
+    arr = np.asarray(img)
+    unique = unique_colors(arr)
+    if unique is not None:
+        colors, inverse = unique
+        color_indices = classify_rgb_array(colors)[inverse, 0]
+    else:
+        color_indices = classify_rgb_array(arr)
+
+    rects = build_svg_rects(color_indices, square_size_mm, OVERLAP_MM)
+
+    # 3. Write the header, one buffered chunk per row of rectangles, then the footer
     try:
-        with open(output_svg_path, "w") as f:
-            f.write("\n".join(svg_content))
+        with open(output_svg_path, "wb", buffering=1 << 20) as f:
+            f.write((svg_header + "\n").encode("ascii"))
+            for row_rects in rects:
+                f.write(("\n".join(row_rects.tolist()) + "\n").encode("ascii"))
+            f.write(b"</svg>")
         print(f"Success! SVG saved to '{output_svg_path}'")
+
+        # Also save a preview PNG of the quantized colors, one pixel per square
+        preview_path = output_svg_path.replace('.svg', '_preview.png')
+        Image.fromarray(PALETTE_RGB[color_indices]).save(preview_path)
+        print(f"Preview image saved to '{preview_path}'")
     except Exception as e:
-        print(f"Error writing SVG file: {e}")
+        print(f"Error writing output files: {e}")
+
+def read_batch_manifest(manifest_path):
+    """
+    Reads a batch manifest with one tab-separated job per line:
+    input, output, square size in mm and an optional (ignored) dithering column.
+
+    Args:
+        manifest_path (str): Path to the manifest file.
+
+    Returns:
+        list: (input path, output path, square size) tuples.
+    """
+    jobs = []
+    with open(manifest_path) as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split("\t")
+            jobs.append((fields[0], fields[1], float(fields[2])))
+    return jobs
+
+
+def process(input_path, output_path, scale=0.25, dither=None):
+    """
+    Converts one image; the entry point used when this module is imported
+    rather than run as a script.
+
+    Args:
+        input_path (str): Path to the input image file.
+        output_path (str): Path to save the output SVG file.
+        scale (float): The size of each square in millimeters.
+        dither: Unused; accepted so both algorithms share one call signature.
+    """
+    generate_pixel_svg(input_path, output_path, scale)
+
+
+def process_batch(jobs):
+    """
+    Converts every (input, output, square size) job in one process, so the
+    interpreter start-up and imports are paid once for the whole batch.
+
+    Args:
+        jobs (list): (input path, output path, square size) tuples.
+    """
+    for input_path, output_path, square_mm in jobs:
+        process(input_path, output_path, square_mm)
+
 
 if __name__ == "__main__":
     # --- Example Usage ---
@@ -144,6 +271,11 @@ if __name__ == "__main__":
     # Default size is 0.25mm
     square_mm = 0.25
 
+    # Batch mode: color_to_squares.py --batch manifest.txt
+    if len(sys.argv) > 2 and sys.argv[1] == "--batch":
+        process_batch(read_batch_manifest(sys.argv[2]))
+        sys.exit(0)
+
     # Check command line arguments for input file, output file, and size
     if len(sys.argv) > 1:
         INPUT_FILE = sys.argv[1]
@@ -159,4 +291,4 @@ if __name__ == "__main__":
 
     print(f"Using input: {INPUT_FILE}, output: {OUTPUT_FILE}, size: {square_mm}mm")
     
-    generate_pixel_svg(INPUT_FILE, OUTPUT_FILE, square_mm)
+    process_batch([(INPUT_FILE, OUTPUT_FILE, square_mm)])
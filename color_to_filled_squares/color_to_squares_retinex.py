@@ -1,11 +1,31 @@
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageFilter
-import colorsys
 import numpy as np
 from scipy.ndimage import gaussian_filter
+from scipy.signal import lfilter, lfilter_zi
+
+try:
+    from numba import njit, prange, get_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is optional: without it the dithering kernels run as plain Python
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def get_num_threads():
+        return 1
 
 # --- Configuration ---
+# Bump whenever a change alters the generated output, so cached results are rebuilt
+ALGORITHM_VERSION = 2
+
 # Target colors and their corresponding RGB values for the laser
 # These are the physical colors achievable with the MOPA laser settings
 TARGET_COLORS = {
@@ -25,6 +45,180 @@ TARGET_COLORS = {
 PALETTE = np.array(list(TARGET_COLORS.values()), dtype=np.float32)
 COLOR_NAMES = list(TARGET_COLORS.keys())
 
+# SVG fill strings, formatted once and indexed by palette index
+HEX_PALETTE = ['#%02X%02X%02X' % tuple(c) for c in PALETTE.astype(int)]
+
+# Luminance weights for the perceptual color distance
+# Weight green more as human vision is more sensitive to it
+LUMINANCE_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+# Contiguous integer copy handed to the JIT-compiled dithering kernels
+# (64-bit so distances and errors computed from it never overflow)
+PALETTE_INT = PALETTE.astype(np.int64, order='C')
+
+def _build_palette_lut(bits):
+    """
+    Precompute the nearest palette index for every color on a coarse RGB grid.
+
+    Args:
+        bits: bits kept per channel (the grid has 2**bits cells per axis)
+
+    Returns:
+        uint8 array (2**bits, 2**bits, 2**bits) indexed by rgb >> (8 - bits)
+    """
+    # Sample each cell at its center
+    cell = 1 << (8 - bits)
+    centers = np.arange(1 << bits, dtype=np.float32) * cell + (cell - 1) / 2.0
+
+    # Weighted squared distance per channel, summed by broadcasting to (n, n, n, N)
+    per_channel = [LUMINANCE_WEIGHTS[c] * (centers[:, None] - PALETTE[None, :, c]) ** 2
+                   for c in range(3)]
+    distances = (per_channel[0][:, None, None, :]
+                 + per_channel[1][None, :, None, :]
+                 + per_channel[2][None, None, :, :])
+
+    return distances.argmin(axis=-1).astype(np.uint8)
+
+# Nearest-color lookup table for the dithering kernels: 6 bits per channel
+# (64^3 entries, 256 KB) turns the palette search into a single indexed load
+# per pixel. It only covers 0-255; accumulated error regularly pushes working
+# values outside that range (the palette itself is out of gamut, e.g. White
+# is 180), and those pixels get an exact search instead. About 1.3% of
+# in-range colors sit in cells that snap to a neighboring palette entry.
+LUT_BITS = 6
+LUT_SHIFT = 8 - LUT_BITS
+PALETTE_LUT = _build_palette_lut(LUT_BITS)
+
+# Palette image for Pillow's built-in quantizer
+PALETTE_IMAGE = Image.new('P', (1, 1))
+PALETTE_IMAGE.putpalette(PALETTE.astype(np.uint8).tobytes())
+
+# Reflected border added on each side before the recursive passes, in sigmas
+BORDER_PAD_SIGMAS = 3
+
+def _yvv_coefficients(sigma):
+    """
+    Filter coefficients of the Young-van Vliet recursive Gaussian approximation.
+
+    Returns:
+        Tuple (b, a) in the form expected by scipy.signal.lfilter
+    """
+    if sigma >= 2.5:
+        q = 0.98711 * sigma - 0.96330
+    else:
+        q = 3.97156 - 4.14554 * np.sqrt(1.0 - 0.26891 * sigma)
+
+    b0 = 1.57825 + 2.44413 * q + 1.4281 * q**2 + 0.422205 * q**3
+    b1 = 2.44413 * q + 2.85619 * q**2 + 1.26661 * q**3
+    b2 = -(1.4281 * q**2 + 1.26661 * q**3)
+    b3 = 0.422205 * q**3
+    B = 1.0 - (b1 + b2 + b3) / b0
+
+    return np.array([B]), np.array([1.0, -b1 / b0, -b2 / b0, -b3 / b0])
+
+def _recursive_pass(data, b, a, axis):
+    """Run the causal recursion along one axis, starting in steady state on the edge value."""
+    zi_shape = [1] * data.ndim
+    zi_shape[axis] = len(a) - 1
+    zi = lfilter_zi(b, a).reshape(zi_shape) * np.take(data, [0], axis=axis)
+    filtered, _ = lfilter(b, a, data, axis=axis, zi=zi)
+    return filtered
+
+def recursive_gaussian(img_array, sigma, axes=(0, 1)):
+    """
+    Gaussian blur using the Young-van Vliet recursive (IIR) filter.
+    Unlike a truncated FIR kernel, the cost per pixel does not grow with sigma,
+    which matters for the large Retinex scales.
+
+    Args:
+        img_array: numpy array to blur
+        sigma: Gaussian standard deviation in pixels
+        axes: axes to blur along (separable, one forward+backward pass each)
+
+    Returns:
+        Blurred float32 array of the same shape
+    """
+    if sigma < 0.5:
+        # The recursive approximation is only valid from sigma 0.5 upward
+        return gaussian_filter(img_array.astype(np.float32),
+                               [sigma if i in axes else 0 for i in range(img_array.ndim)])
+
+    b, a = _yvv_coefficients(sigma)
+    blurred = np.asarray(img_array, dtype=np.float64)
+    pad = int(np.ceil(BORDER_PAD_SIGMAS * sigma))
+
+    for axis in axes:
+        # Mirror the edges like gaussian_filter's 'reflect' mode, so the
+        # passes start far enough out that their initial state has decayed
+        # by the time they reach the image
+        pad_width = [(0, 0)] * blurred.ndim
+        pad_width[axis] = (pad, pad)
+        padded = np.pad(blurred, pad_width, mode='symmetric')
+
+        # Forward (causal) pass, then backward (anti-causal) pass
+        padded = _recursive_pass(padded, b, a, axis)
+        padded = np.flip(_recursive_pass(np.flip(padded, axis), b, a, axis), axis)
+
+        crop = [slice(None)] * blurred.ndim
+        crop[axis] = slice(pad, pad + blurred.shape[axis])
+        blurred = padded[tuple(crop)]
+
+    return blurred.astype(np.float32)
+
+# Scales at or above this sigma are blurred on a downsampled image
+PYRAMID_MIN_SIGMA = 32
+
+def _upsample_linear(small, k, size, axis):
+    """
+    Linearly interpolate samples taken every k pixels back to full size along one axis.
+
+    Full-resolution pixel p lies at p / k in the downsampled grid; positions
+    past the last sample are clamped to it.
+    """
+    position = np.arange(size, dtype=np.float32) / k
+    lower = np.minimum(position.astype(np.intp), small.shape[axis] - 1)
+    upper = np.minimum(lower + 1, small.shape[axis] - 1)
+
+    weight_shape = [1] * small.ndim
+    weight_shape[axis] = size
+    weight = (position - lower).astype(np.float32).reshape(weight_shape)
+
+    below = np.take(small, lower, axis=axis)
+    above = np.take(small, upper, axis=axis)
+    return below + (above - below) * weight
+
+def pyramid_gaussian(img_array, sigma):
+    """
+    Approximate a large Gaussian blur by filtering a downsampled image.
+    The blurred result is so smooth that sampling every k-th pixel, blurring
+    with sigma / k and interpolating back up loses nothing visible, at 1/k^2
+    of the pixel count.
+
+    Args:
+        img_array: numpy array (H, W, 3)
+        sigma: Gaussian standard deviation in full-resolution pixels
+
+    Returns:
+        Blurred float32 array (H, W, 3)
+    """
+    k = int(sigma // PYRAMID_MIN_SIGMA)
+    if k < 2:
+        return recursive_gaussian(img_array, sigma, axes=(0, 1))
+
+    height, width = img_array.shape[:2]
+    small = recursive_gaussian(img_array[::k, ::k], sigma / k, axes=(0, 1))
+
+    # Separable bilinear upsample back to full size
+    upsampled = _upsample_linear(small, k, height, axis=0)
+    return _upsample_linear(upsampled, k, width, axis=1)
+
+def _log_illumination(img_float, sigma):
+    """Log of the blurred image (the illumination estimate) for one Retinex scale."""
+    # Blur all three channels at once along the spatial axes only
+    blurred = pyramid_gaussian(img_float, sigma)
+    blurred += 1.0
+    return np.log(blurred, out=blurred)
+
 def retinex_enhancement(img_array, sigma_list=[15, 80, 250]):
     """
     Apply Multi-Scale Retinex (MSR) to enhance local color contrasts.
@@ -35,33 +229,88 @@ def retinex_enhancement(img_array, sigma_list=[15, 80, 250]):
         sigma_list: list of Gaussian kernel sizes for multi-scale processing
 
     Returns:
-        Enhanced image array (H, W, 3) with improved color contrast
+        Enhanced float32 array (H, W, 3) in the 0-255 range with improved color contrast
     """
     img_float = img_array.astype(np.float32) + 1.0  # Add 1 to avoid log(0)
 
-    retinex = np.zeros_like(img_float)
-
-    # Apply multi-scale Retinex
-    for sigma in sigma_list:
-        # Apply Gaussian blur to each channel
-        for i in range(3):
-            blurred = gaussian_filter(img_float[:, :, i], sigma=sigma)
-            # Compute log ratio (reflectance / illumination)
-            retinex[:, :, i] += np.log10(img_float[:, :, i]) - np.log10(blurred + 1.0)
-
-    # Average across scales
-    retinex = retinex / len(sigma_list)
-
-    # Normalize to 0-255 range
-    for i in range(3):
-        channel = retinex[:, :, i]
-        min_val, max_val = channel.min(), channel.max()
-        if max_val > min_val:
-            retinex[:, :, i] = 255 * (channel - min_val) / (max_val - min_val)
-        else:
-            retinex[:, :, i] = 128
+    # Natural log: the base only scales the result, which normalization cancels.
+    # The image term is the same at every scale, so add it once for all of them.
+    retinex = np.log(img_float)
+    retinex *= len(sigma_list)
+
+    # Apply multi-scale Retinex. The scales are independent and the filters
+    # release the GIL, so each one is blurred on its own thread.
+    with ThreadPoolExecutor(max_workers=len(sigma_list)) as executor:
+        log_illuminations = executor.map(lambda sigma: _log_illumination(img_float, sigma), sigma_list)
+        for log_illumination in log_illuminations:
+            # Subtract the log illumination (log ratio = reflectance / illumination)
+            retinex -= log_illumination
+
+    # Normalize each channel to 0-255 range. Averaging across scales is a
+    # uniform scale factor that the normalization cancels, so it is skipped.
+    # Flat channels (max == min) get scale 0 and are offset to mid-gray.
+    min_val = retinex.min(axis=(0, 1), keepdims=True)
+    span = retinex.max(axis=(0, 1), keepdims=True) - min_val
+    scale = np.divide(255.0, span, out=np.zeros_like(span), where=span > 0)
+    retinex -= min_val
+    retinex *= scale
+    retinex += np.where(span > 0, 0.0, 128.0).astype(np.float32)
+
+    # Stay in float32; the cast to integers happens once, at quantization
+    return np.clip(retinex, 0, 255, out=retinex)
+
+def rgb2hsv_np(arr):
+    """
+    Vectorized RGB to HSV conversion (same conventions as colorsys).
 
-    return np.clip(retinex, 0, 255).astype(np.uint8)
+    Args:
+        arr: numpy array (H, W, 3) of RGB values in the 0-1 range
+
+    Returns:
+        Array (H, W, 3) of hue, saturation and value, each in the 0-1 range
+    """
+    r, g, b = arr[..., 0], arr[..., 1], arr[..., 2]
+    v = arr.max(axis=2)
+    delta = np.ptp(arr, axis=2)
+    s = np.where(v > 0, delta / np.where(v > 0, v, 1), 0)
+
+    # The channel holding the maximum selects one of the hue sectors
+    safe_delta = np.where(delta > 0, delta, 1)
+    max_channel = np.argmax(arr, axis=2)
+    h = np.select(
+        [max_channel == 0, max_channel == 1],
+        [(g - b) / safe_delta, 2.0 + (b - r) / safe_delta],
+        default=4.0 + (r - g) / safe_delta,
+    )
+    h = np.where(delta > 0, (h / 6.0) % 1.0, 0)
+
+    return np.stack([h, s, v], axis=2)
+
+def hsv2rgb_np(hsv):
+    """
+    Vectorized HSV to RGB conversion (inverse of rgb2hsv_np).
+
+    Args:
+        hsv: numpy array (H, W, 3) of hue, saturation and value in the 0-1 range
+
+    Returns:
+        Array (H, W, 3) of RGB values in the 0-1 range
+    """
+    h, s, v = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+    sector = np.floor(h * 6.0)
+    f = h * 6.0 - sector
+    sector = sector.astype(np.int32) % 6
+
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+
+    conditions = [sector == 0, sector == 1, sector == 2, sector == 3, sector == 4]
+    r = np.select(conditions, [v, q, p, p, t], default=v)
+    g = np.select(conditions, [t, v, v, q, p], default=p)
+    b = np.select(conditions, [p, p, t, v, v], default=q)
+
+    return np.stack([r, g, b], axis=2)
 
 def enhance_color_differential(img_array, strength=1.5):
     """
@@ -69,101 +318,242 @@ def enhance_color_differential(img_array, strength=1.5):
     Increases saturation while preserving hue relationships.
 
     Args:
-        img_array: numpy array (H, W, 3)
+        img_array: numpy array (H, W, 3), uint8 or float in the 0-255 range
         strength: enhancement factor (1.0 = no change, >1.0 = more saturation)
 
     Returns:
-        Enhanced image array
+        Enhanced float32 array (H, W, 3) in the 0-255 range
     """
-    img_hsv = np.zeros_like(img_array, dtype=np.float32)
-
     # Convert to HSV
-    for y in range(img_array.shape[0]):
-        for x in range(img_array.shape[1]):
-            r, g, b = img_array[y, x] / 255.0
-            h, s, v = colorsys.rgb_to_hsv(r, g, b)
+    hsv = rgb2hsv_np(np.asarray(img_array, dtype=np.float32) / 255.0)
+    s, v = hsv[..., 1], hsv[..., 2]
+
+    # Enhance saturation with adaptive strength based on value
+    # Don't oversaturate very dark or very bright pixels
+    adaptive_strength = strength * (1.0 - np.abs(v - 0.5) * 0.5)
+    hsv[..., 1] = np.minimum(1.0, s * adaptive_strength)
 
-            # Enhance saturation with adaptive strength based on value
-            # Don't oversaturate very dark or very bright pixels
-            adaptive_strength = strength * (1.0 - abs(v - 0.5) * 0.5)
-            s = min(1.0, s * adaptive_strength)
+    # Convert back to RGB
+    img = hsv2rgb_np(hsv) * 255
 
-            # Convert back to RGB
-            r, g, b = colorsys.hsv_to_rgb(h, s, v)
-            img_hsv[y, x] = [r * 255, g * 255, b * 255]
+    return np.clip(img, 0, 255, out=img)
 
-    return np.clip(img_hsv, 0, 255).astype(np.uint8)
+# Images with fewer rows than this are dithered serially: the wavefront only
+# has a few rows in flight at a time, so threading would not pay for itself
+WAVEFRONT_MIN_ROWS = 64
 
-def find_closest_palette_color(pixel):
+@njit(cache=True)
+def _closest_palette_index(palette, r, g, b):
     """
-    Find the closest color in the target palette using perceptual color distance.
+    Exact nearest palette color by luminance-weighted squared distance.
+
+    Returns:
+        Index of the closest palette color
+    """
+    best_idx = 0
+    best_distance = np.inf
+    for i in range(palette.shape[0]):
+        dr = r - palette[i, 0]
+        dg = g - palette[i, 1]
+        db = b - palette[i, 2]
+        distance = (LUMINANCE_WEIGHTS[0] * dr * dr + LUMINANCE_WEIGHTS[1] * dg * dg
+                    + LUMINANCE_WEIGHTS[2] * db * db)
+        if distance < best_distance:
+            best_distance = distance
+            best_idx = i
+    return best_idx
+
+@njit(cache=True)
+def _quantize_pixel(working_image, palette, lut, output_image, output_indices, y, x):
+    """
+    Snap one pixel of the working image to its nearest palette color.
+
+    Returns:
+        Index of the chosen palette color
+    """
+    r = working_image[y, x, 0]
+    g = working_image[y, x, 1]
+    b = working_image[y, x, 2]
+    if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
+        palette_idx = lut[r >> LUT_SHIFT, g >> LUT_SHIFT, b >> LUT_SHIFT]
+    else:
+        # Accumulated error has left the table's range; clamping would change
+        # which color is nearest, so search the palette exactly
+        palette_idx = _closest_palette_index(palette, r, g, b)
+
+    output_indices[y, x] = palette_idx
+    for c in range(3):
+        output_image[y, x, c] = np.uint8(palette[palette_idx, c])
+
+    return palette_idx
+
+@njit(cache=True)
+def _fs_pixel(working_image, palette, lut, output_image, output_indices, y, x):
+    """Quantize one pixel and diffuse its error with the Floyd-Steinberg weights."""
+    height, width = working_image.shape[0], working_image.shape[1]
+    palette_idx = _quantize_pixel(working_image, palette, lut, output_image, output_indices, y, x)
+
+    for c in range(3):
+        # Distribute error to neighboring pixels: round each n/16 share, and
+        # give the last neighbor the remainder so no error is lost
+        quant_error = working_image[y, x, c] - palette[palette_idx, c]
+        share_right = (quant_error * 7 + 8) >> 4
+        share_down_left = (quant_error * 3 + 8) >> 4
+        share_down = (quant_error * 5 + 8) >> 4
+        share_down_right = quant_error - share_right - share_down_left - share_down
+        if x + 1 < width:
+            working_image[y, x + 1, c] += share_right
+        if y + 1 < height:
+            if x > 0:
+                working_image[y + 1, x - 1, c] += share_down_left
+            working_image[y + 1, x, c] += share_down
+            if x + 1 < width:
+                working_image[y + 1, x + 1, c] += share_down_right
+
+@njit(cache=True)
+def _atkinson_pixel(working_image, palette, lut, output_image, output_indices, y, x):
+    """Quantize one pixel and diffuse 6/8 of its error with the Atkinson pattern."""
+    height, width = working_image.shape[0], working_image.shape[1]
+    palette_idx = _quantize_pixel(working_image, palette, lut, output_image, output_indices, y, x)
+
+    for c in range(3):
+        # Atkinson dithering pattern - distributes 6/8 of error
+        # (keeps images slightly brighter); each 1/8 share is rounded and the
+        # last neighbor gets the remainder so exactly 6/8 is passed on
+        error = working_image[y, x, c] - palette[palette_idx, c]
+        quant_error = (error + 4) >> 3
+        last_share = ((error * 6 + 4) >> 3) - 5 * quant_error
+        if x + 1 < width:
+            working_image[y, x + 1, c] += quant_error
+        if x + 2 < width:
+            working_image[y, x + 2, c] += quant_error
+        if y + 1 < height:
+            if x > 0:
+                working_image[y + 1, x - 1, c] += quant_error
+            working_image[y + 1, x, c] += quant_error
+            if x + 1 < width:
+                working_image[y + 1, x + 1, c] += quant_error
+        if y + 2 < height:
+            working_image[y + 2, x, c] += last_share
+
+@njit(cache=True)
+def _fs_dither(working_image, palette, lut):
+    """
+    Floyd-Steinberg error diffusion kernel. Modifies working_image in place.
 
     Args:
-        pixel: RGB tuple (3,) as numpy array
+        working_image: int16 array (H, W, 3) used for error accumulation
+        palette: contiguous int64 array (N, 3) of palette colors
+        lut: nearest-color lookup table (PALETTE_LUT)
 
     Returns:
-        Index of closest palette color
+        Tuple of (output_array uint8 (H, W, 3), color_indices int32 (H, W))
     """
-    # Use weighted Euclidean distance in RGB space
-    # Weight green more as human vision is more sensitive to it
-    weights = np.array([0.299, 0.587, 0.114])  # Luminance weights
+    height, width = working_image.shape[0], working_image.shape[1]
+    output_image = np.zeros((height, width, 3), dtype=np.uint8)
+    output_indices = np.zeros((height, width), dtype=np.int32)
 
-    diff = PALETTE - pixel
-    distances = np.sqrt(np.sum((diff ** 2) * weights, axis=1))
+    for y in range(height):
+        for x in range(width):
+            _fs_pixel(working_image, palette, lut, output_image, output_indices, y, x)
 
-    return np.argmin(distances)
+    return output_image, output_indices
 
-def floyd_steinberg_dithering(img_array):
+@njit(cache=True)
+def _atkinson_dither(working_image, palette, lut):
     """
-    Apply Floyd-Steinberg error diffusion dithering with the target palette.
-    This creates spatial color mixing that expands the effective gamut.
+    Atkinson error diffusion kernel. Modifies working_image in place.
 
     Args:
-        img_array: numpy array (H, W, 3) of the input image
+        working_image: int16 array (H, W, 3) used for error accumulation
+        palette: contiguous int64 array (N, 3) of palette colors
+        lut: nearest-color lookup table (PALETTE_LUT)
 
     Returns:
-        Tuple of (output_array, color_indices) where:
-            output_array: dithered image as (H, W, 3)
-            color_indices: (H, W) array of palette indices for SVG generation
+        Tuple of (output_array uint8 (H, W, 3), color_indices int32 (H, W))
     """
-    height, width = img_array.shape[:2]
-
-    # Work with float for error accumulation
-    working_image = img_array.astype(np.float32).copy()
+    height, width = working_image.shape[0], working_image.shape[1]
+    output_image = np.zeros((height, width, 3), dtype=np.uint8)
     output_indices = np.zeros((height, width), dtype=np.int32)
-    output_image = np.zeros_like(img_array)
-
-    # Floyd-Steinberg error diffusion matrix
-    # Distributes error to:  [ ] [X] [ ]
-    #                        [ ] [7] [5] [3] [1]  (divided by 16)
 
     for y in range(height):
         for x in range(width):
-            old_pixel = working_image[y, x]
+            _atkinson_pixel(working_image, palette, lut, output_image, output_indices, y, x)
 
-            # Find closest palette color
-            palette_idx = find_closest_palette_color(old_pixel)
-            new_pixel = PALETTE[palette_idx]
+    return output_image, output_indices
 
-            output_indices[y, x] = palette_idx
-            output_image[y, x] = new_pixel
+@njit(cache=True, parallel=True)
+def _fs_dither_wavefront(working_image, palette, lut):
+    """
+    Parallel Floyd-Steinberg using a diagonal wavefront.
 
-            # Calculate quantization error
-            quant_error = old_pixel - new_pixel
+    Row y runs 3 pixels behind row y-1: at step t every row processes pixel
+    x = t - 3*y, in parallel. Everything a pixel receives error from was
+    handled in an earlier step, and with a lag of 3 no two rows write the same
+    pixel within a step, so the result is identical to the serial kernel.
+    """
+    height, width = working_image.shape[0], working_image.shape[1]
+    output_image = np.zeros((height, width, 3), dtype=np.uint8)
+    output_indices = np.zeros((height, width), dtype=np.int32)
+    lag = 3
 
-            # Distribute error to neighboring pixels (Floyd-Steinberg)
-            if x + 1 < width:
-                working_image[y, x + 1] += quant_error * 7/16
+    for step in range(width + lag * (height - 1)):
+        first_row = max(0, (step - width) // lag + 1)
+        last_row = min(height - 1, step // lag)
+        for y in prange(first_row, last_row + 1):
+            _fs_pixel(working_image, palette, lut, output_image, output_indices, y, step - lag * y)
 
-            if y + 1 < height:
-                if x > 0:
-                    working_image[y + 1, x - 1] += quant_error * 3/16
-                working_image[y + 1, x] += quant_error * 5/16
-                if x + 1 < width:
-                    working_image[y + 1, x + 1] += quant_error * 1/16
+    return output_image, output_indices
+
+@njit(cache=True, parallel=True)
+def _atkinson_dither_wavefront(working_image, palette, lut):
+    """
+    Parallel Atkinson dithering using a diagonal wavefront.
+
+    Same scheme as _fs_dither_wavefront; Atkinson reaches two pixels right and
+    two rows down, so rows lag by 4 to keep writes within a step disjoint.
+    """
+    height, width = working_image.shape[0], working_image.shape[1]
+    output_image = np.zeros((height, width, 3), dtype=np.uint8)
+    output_indices = np.zeros((height, width), dtype=np.int32)
+    lag = 4
+
+    for step in range(width + lag * (height - 1)):
+        first_row = max(0, (step - width) // lag + 1)
+        last_row = min(height - 1, step // lag)
+        for y in prange(first_row, last_row + 1):
+            _atkinson_pixel(working_image, palette, lut, output_image, output_indices, y, step - lag * y)
 
     return output_image, output_indices
 
+def _use_wavefront(height):
+    """Whether the parallel wavefront kernels are worth using for an image this tall."""
+    return NUMBA_AVAILABLE and get_num_threads() > 1 and height >= WAVEFRONT_MIN_ROWS
+
+def floyd_steinberg_dithering(img_array):
+    """
+    Apply Floyd-Steinberg error diffusion dithering with the target palette.
+    This creates spatial color mixing that expands the effective gamut.
+
+    Args:
+        img_array: numpy array (H, W, 3) of the input image, uint8 or float 0-255
+
+    Returns:
+        Tuple of (output_array, color_indices) where:
+            output_array: dithered image as (H, W, 3)
+            color_indices: (H, W) array of palette indices for SVG generation
+    """
+    # Work with int16 for error accumulation: palette colors and errors are
+    # whole numbers, and half-width samples halve the memory traffic
+    # Float input from the enhancement stages is truncated in the same copy
+    # Floyd-Steinberg error diffusion matrix
+    # Distributes error to:  [ ] [X] [7]
+    #                        [3] [5] [1]  (divided by 16)
+    working_image = np.array(img_array, dtype=np.int16, order='C')
+    if _use_wavefront(working_image.shape[0]):
+        return _fs_dither_wavefront(working_image, PALETTE_INT, PALETTE_LUT)
+    return _fs_dither(working_image, PALETTE_INT, PALETTE_LUT)
+
 def atkinson_dithering(img_array):
     """
     Apply Atkinson dithering - produces sharper results with less error diffusion.
@@ -174,40 +564,150 @@ def atkinson_dithering(img_array):
         [1] [1] [1] [ ]
         [ ] [1] [ ] [ ]  (all divided by 8)
     """
+    working_image = np.array(img_array, dtype=np.int16, order='C')
+    if _use_wavefront(working_image.shape[0]):
+        return _atkinson_dither_wavefront(working_image, PALETTE_INT, PALETTE_LUT)
+    return _atkinson_dither(working_image, PALETTE_INT, PALETTE_LUT)
+
+def pillow_floyd_steinberg_dithering(img):
+    """
+    Floyd-Steinberg dithering done entirely by Pillow's C quantizer.
+    Only used for unenhanced images: Pillow matches colors by plain RGB
+    distance rather than the luminance-weighted distance used elsewhere.
+
+    Args:
+        img: PIL RGB image
+
+    Returns:
+        Tuple of (output_array, color_indices), as for the dithering functions
+    """
+    quantized = img.quantize(palette=PALETTE_IMAGE, dither=Image.Dither.FLOYDSTEINBERG)
+    color_indices = np.asarray(quantized).astype(np.int32)
+    output_img = PALETTE[color_indices].astype(np.uint8)
+
+    return output_img, color_indices
+
+def nearest_color_mapping(img_array):
+    """
+    Map every pixel to its closest palette color without dithering.
+
+    Args:
+        img_array: numpy array (H, W, 3) of the input image, uint8 or float 0-255
+
+    Returns:
+        Tuple of (output_array, color_indices), as for the dithering functions
+    """
     height, width = img_array.shape[:2]
-    working_image = img_array.astype(np.float32).copy()
-    output_indices = np.zeros((height, width), dtype=np.int32)
-    output_image = np.zeros_like(img_array)
+    flat = img_array.reshape(-1, 3)
+
+    # Exact weighted distances, one palette entry at a time, keeping only a
+    # running minimum and its index per pixel so the temporaries stay (N,)
+    # rather than (N, palette, 3); sqrt is monotonic so it is skipped.
+    # (The coarse lookup table is only used inside the dithering kernels.)
+    best = np.full(flat.shape[0], np.inf, dtype=np.float32)
+    indices = np.zeros(flat.shape[0], dtype=np.int32)
+    distance = np.empty(flat.shape[0], dtype=np.float32)
+    diff = np.empty(flat.shape[0], dtype=np.float32)
+    for i, color in enumerate(PALETTE):
+        distance.fill(0.0)
+        for c in range(3):
+            np.subtract(flat[:, c], color[c], out=diff, dtype=np.float32)
+            diff *= diff
+            diff *= LUMINANCE_WEIGHTS[c]
+            distance += diff
+        closer = distance < best
+        best[closer] = distance[closer]
+        indices[closer] = i
+
+    color_indices = indices.reshape(height, width)
+    output_img = PALETTE[color_indices].astype(np.uint8)
+
+    return output_img, color_indices
+
+def build_svg_rects(color_indices, square_size_mm, overlap_mm):
+    """
+    Build the SVG <rect> elements for a palette index map.
 
-    for y in range(height):
-        for x in range(width):
-            old_pixel = working_image[y, x]
-            palette_idx = find_closest_palette_color(old_pixel)
-            new_pixel = PALETTE[palette_idx]
+    Horizontal runs of same-color pixels within a row are merged into a single
+    wider rectangle. Numeric fields are formatted with np.char.mod and combined
+    with vectorized string concatenation instead of per-rect f-strings.
+
+    Args:
+        color_indices: (H, W) array of palette indices
+        square_size_mm: The size of each square in millimeters
+        overlap_mm: Extra width/height added to each rectangle so that
+            neighbors overlap slightly and leave no hairline gaps
+
+    Yields:
+        Array of <rect> element strings for each image row, so callers can
+        write rows out as they go instead of holding the whole SVG in memory
+    """
+    height, width = color_indices.shape
+    # Everything after the width attribute depends only on the palette color
+    tails = np.array([
+        f'" height="{square_size_mm + overlap_mm:.4f}" fill="{color_hex}" />'
+        for color_hex in HEX_PALETTE
+    ])
+
+    for y, row in enumerate(color_indices):
+        # Run boundaries: positions where the color differs from its left neighbor
+        changes = np.flatnonzero(np.diff(row)) + 1
+        starts = np.r_[0, changes]
+        ends = np.r_[changes, width]
+
+        heads = np.char.add(
+            np.char.add('<rect x="', np.char.mod('%.4f', starts * square_size_mm)),
+            f'" y="{y * square_size_mm:.4f}" width="',
+        )
+        widths = np.char.mod('%.4f', (ends - starts) * square_size_mm + overlap_mm)
+        yield np.char.add(np.char.add(heads, widths), tails[row[starts]])
+
+# Images with at most this many distinct colors run the per-pixel stages
+# once per color instead of once per pixel
+UNIQUE_COLOR_LIMIT = 4096
+
+def unique_colors(img_array, limit=UNIQUE_COLOR_LIMIT):
+    """
+    Find the distinct colors of an image.
 
-            output_indices[y, x] = palette_idx
-            output_image[y, x] = new_pixel
+    Only called on the decoded uint8 image, before any float processing;
+    float values would be truncated when the channels are packed.
 
-            quant_error = old_pixel - new_pixel
+    Args:
+        img_array: numpy array (H, W, 3) of uint8 RGB values
+        limit: give up when the image has more distinct colors than this
 
-            # Atkinson dithering pattern - distributes 6/8 of error
-            # (keeps images slightly brighter)
-            if x + 1 < width:
-                working_image[y, x + 1] += quant_error * 1/8
-            if x + 2 < width:
-                working_image[y, x + 2] += quant_error * 1/8
+    Returns:
+        Tuple (colors, inverse): colors is an (N, 1, 3) uint8 "image" of the
+        distinct colors and inverse (H, W) gives each pixel's row in it.
+        None if the image has more than limit colors. Callers may replace
+        colors with its float32 enhanced version (enhance_color_differential).
+    """
+    rgb = img_array.astype(np.uint32)
+    codes = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+    unique_codes, inverse = np.unique(codes.ravel(), return_inverse=True)
+    if len(unique_codes) > limit:
+        return None
 
-            if y + 1 < height:
-                if x > 0:
-                    working_image[y + 1, x - 1] += quant_error * 1/8
-                working_image[y + 1, x] += quant_error * 1/8
-                if x + 1 < width:
-                    working_image[y + 1, x + 1] += quant_error * 1/8
+    colors = np.stack([unique_codes >> 16, (unique_codes >> 8) & 0xFF, unique_codes & 0xFF],
+                      axis=-1).astype(np.uint8)
+    return colors[:, None, :], inverse.reshape(img_array.shape[:2])
 
-            if y + 2 < height:
-                working_image[y + 2, x] += quant_error * 1/8
+def exact_palette_indices(colors):
+    """
+    Palette index of each color if every color is exactly a palette entry.
 
-    return output_image, output_indices
+    Args:
+        colors: numpy array (N, 1, 3) of RGB values 0-255, either the uint8
+            colors from unique_colors or their float32 enhanced version
+
+    Returns:
+        int32 array (N,) of palette indices, or None if any color is off-palette
+    """
+    matches = (colors[:, 0, None, :] == PALETTE_INT[None, :, :]).all(axis=-1)
+    if not matches.any(axis=1).all():
+        return None
+    return matches.argmax(axis=1).astype(np.int32)
 
 def generate_pixel_svg_retinex(input_image_path, output_svg_path, square_size_mm=0.25,
                                 apply_retinex=True, enhance_saturation=True,
@@ -236,8 +736,12 @@ def generate_pixel_svg_retinex(input_image_path, output_svg_path, square_size_mm
     width, height = img.size
     print(f"Processing image: {width}x{height} pixels.")
 
-    # Convert to numpy array for processing
-    img_array = np.array(img)
+    # Read-only view of the pixel buffer; every stage below returns a new array
+    img_array = np.asarray(img)
+
+    # Retinex looks at each pixel's neighbourhood, so only images that skip it
+    # can be processed per distinct color
+    unique = None if apply_retinex else unique_colors(img_array)
 
     # Apply Retinex enhancement
     if apply_retinex:
@@ -247,65 +751,68 @@ def generate_pixel_svg_retinex(input_image_path, output_svg_path, square_size_mm
     # Enhance color differentials
     if enhance_saturation:
         print("Enhancing color saturation...")
-        img_array = enhance_color_differential(img_array, strength=1.5)
+        if unique is not None:
+            colors, inverse = unique
+            colors = enhance_color_differential(colors, strength=1.5)
+            unique = (colors, inverse)
+            img_array = colors[inverse, 0]
+        else:
+            img_array = enhance_color_differential(img_array, strength=1.5)
+
+    # An image made only of palette colors leaves no error to diffuse,
+    # so every method would return it unchanged
+    palette_indices = exact_palette_indices(unique[0]) if unique is not None else None
 
     # Apply dithering
-    if dithering_method == 'floyd-steinberg':
+    if palette_indices is not None:
+        print("Image is already on the palette - skipping dithering...")
+        color_indices = palette_indices[unique[1]]
+        output_img = PALETTE[color_indices].astype(np.uint8)
+    elif dithering_method == 'floyd-steinberg' and not (apply_retinex or enhance_saturation):
+        # Nothing was changed in NumPy, so let Pillow quantize the image in one call
+        print("Applying Floyd-Steinberg dithering (Pillow)...")
+        output_img, color_indices = pillow_floyd_steinberg_dithering(img)
+    elif dithering_method == 'floyd-steinberg':
         print("Applying Floyd-Steinberg dithering...")
         output_img, color_indices = floyd_steinberg_dithering(img_array)
     elif dithering_method == 'atkinson':
         print("Applying Atkinson dithering...")
         output_img, color_indices = atkinson_dithering(img_array)
+    elif unique is not None:
+        print("No dithering - using nearest color matching...")
+        colors, inverse = unique
+        _, indices = nearest_color_mapping(colors)
+        color_indices = indices[inverse, 0]
+        output_img = PALETTE[color_indices].astype(np.uint8)
     else:
         print("No dithering - using nearest color matching...")
-        color_indices = np.zeros((height, width), dtype=np.int32)
-        output_img = np.zeros_like(img_array)
-        for y in range(height):
-            for x in range(width):
-                idx = find_closest_palette_color(img_array[y, x])
-                color_indices[y, x] = idx
-                output_img[y, x] = PALETTE[idx]
+        output_img, color_indices = nearest_color_mapping(img_array)
 
     # Generate SVG
     svg_width_mm = width * square_size_mm
     svg_height_mm = height * square_size_mm
-    STROKE_WIDTH_MM = 0.01
+    # Fill-only squares, grown by half the old 0.01mm stroke to avoid hairline gaps
+    OVERLAP_MM = 0.005
 
     print(f"Output SVG size: {svg_width_mm:.2f}mm x {svg_height_mm:.2f}mm.")
     print("Generating SVG...")
 
-    svg_content = []
-    svg_content.append(f"""<svg width="{svg_width_mm}mm" height="{svg_height_mm}mm" viewBox="0 0 {svg_width_mm} {svg_height_mm}" xmlns="http://www.w3.org/2000/svg">""")
+    svg_header = [f"""<svg width="{svg_width_mm}mm" height="{svg_height_mm}mm" viewBox="0 0 {svg_width_mm} {svg_height_mm}" xmlns="http://www.w3.org/2000/svg">"""]
 
     # Add comment with processing info
-    svg_content.append(f"<!-- Generated with Retinex-enhanced spatial dithering -->")
-    svg_content.append(f"<!-- Retinex: {apply_retinex}, Saturation: {enhance_saturation}, Dithering: {dithering_method} -->")
+    svg_header.append(f"<!-- Generated with Retinex-enhanced spatial dithering -->")
+    svg_header.append(f"<!-- Retinex: {apply_retinex}, Saturation: {enhance_saturation}, Dithering: {dithering_method} -->")
 
     # Generate rectangles
-    for y in range(height):
-        for x in range(width):
-            palette_idx = color_indices[y, x]
-            color_name = COLOR_NAMES[palette_idx]
-            r, g, b = PALETTE[palette_idx].astype(int)
-            color_hex = f"#{r:02X}{g:02X}{b:02X}"
+    rects = build_svg_rects(color_indices, square_size_mm, OVERLAP_MM)
 
-            x_mm = x * square_size_mm
-            y_mm = y * square_size_mm
-
-            rect = (
-                f'<rect x="{x_mm:.4f}" y="{y_mm:.4f}" '
-                f'width="{square_size_mm:.4f}" height="{square_size_mm:.4f}" '
-                f'fill="{color_hex}" stroke="{color_hex}" '
-                f'stroke-width="{STROKE_WIDTH_MM:.4f}" />'
-            )
-            svg_content.append(rect)
-
-    svg_content.append("</svg>")
-
-    # Write SVG file
+    # Write SVG file, streaming one buffered chunk per row of rectangles
     try:
-        with open(output_svg_path, "w") as f:
-            f.write("\n".join(svg_content))
+        with open(output_svg_path, "wb", buffering=1 << 20) as f:
+            f.write(("\n".join(svg_header) + "\n").encode("ascii"))
+            for row_rects in rects:
+                f.write(("\n".join(row_rects.tolist()) + "\n").encode("ascii"))
+            f.write(b"</svg>")
         print(f"Success! SVG saved to '{output_svg_path}'")
 
         # Also save a preview PNG
@@ -316,11 +823,72 @@ def generate_pixel_svg_retinex(input_image_path, output_svg_path, square_size_mm
     except Exception as e:
         print(f"Error writing output files: {e}")
 
+def read_batch_manifest(manifest_path):
+    """
+    Read a batch manifest with one tab-separated job per line:
+    input, output, square size in mm and dithering method.
+
+    Args:
+        manifest_path: Path to the manifest file
+
+    Returns:
+        List of (input path, output path, square size, dithering) tuples
+    """
+    jobs = []
+    with open(manifest_path) as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if not line or line.startswith('#'):
+                continue
+            fields = line.split('\t')
+            dithering = fields[3] if len(fields) > 3 else 'floyd-steinberg'
+            jobs.append((fields[0], fields[1], float(fields[2]), dithering))
+    return jobs
+
+
+def process(input_path, output_path, scale=0.25, dither=None):
+    """
+    Process one image with Retinex enhancement; the entry point used when
+    this module is imported rather than run as a script.
+
+    Args:
+        input_path: Path to input image
+        output_path: Path to output SVG
+        scale: Size of each square in mm
+        dither: 'floyd-steinberg' (default), 'atkinson', or 'none'
+    """
+    generate_pixel_svg_retinex(
+        input_path,
+        output_path,
+        scale,
+        apply_retinex=True,
+        enhance_saturation=True,
+        dithering_method=dither or 'floyd-steinberg'
+    )
+
+
+def process_batch(jobs):
+    """
+    Process every job in one process so interpreter start-up and imports
+    are paid once for the whole batch.
+
+    Args:
+        jobs: List of (input path, output path, square size, dithering) tuples
+    """
+    for input_path, output_path, square_mm, dithering in jobs:
+        process(input_path, output_path, square_mm, dithering)
+
+
 if __name__ == "__main__":
     INPUT_FILE = "input.png"
     OUTPUT_FILE = "output_retinex.svg"
     square_mm = 0.25
 
+    # Batch mode: color_to_squares_retinex.py --batch manifest.txt
+    if len(sys.argv) > 2 and sys.argv[1] == '--batch':
+        process_batch(read_batch_manifest(sys.argv[2]))
+        sys.exit(0)
+
     # Parse command line arguments
     if len(sys.argv) > 1:
         INPUT_FILE = sys.argv[1]
@@ -343,11 +911,4 @@ if __name__ == "__main__":
     print(f"Using input: {INPUT_FILE}, output: {OUTPUT_FILE}, size: {square_mm}mm")
     print(f"Dithering method: {dithering}")
 
-    generate_pixel_svg_retinex(
-        INPUT_FILE,
-        OUTPUT_FILE,
-        square_mm,
-        apply_retinex=True,
-        enhance_saturation=True,
-        dithering_method=dithering
-    )
+    process_batch([(INPUT_FILE, OUTPUT_FILE, square_mm, dithering)])
@@ -19,55 +19,68 @@ Each test category contains:
 
 import os
 import sys
+import json
+import hashlib
 from pathlib import Path
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+import generate_test_patterns as patterns_module
 from generate_test_patterns import *
 
 
 # Test suite organization
+# Each generator is a (function, args) tuple: picklable for the worker
+# processes and hashable, unlike a lambda
 TEST_CATEGORIES = {
     "01_quick_start": {
         "description": "🚀 START HERE - Quick visual comparison (5-10 min laser time)",
         "tests": [
-            ("grayscale_gradient", lambda: create_linear_gradient(600, 100, (0, 0, 0), (255, 255, 255))),
-            ("smooth_gradients", lambda: create_smooth_gradient_test(400, 60)),  # Smaller for quick test
-            ("color_patches", lambda: create_color_patches(patch_size=60, margin=8)),
+            ("grayscale_gradient", (create_linear_gradient, (600, 100, (0, 0, 0), (255, 255, 255)))),
+            ("smooth_gradients", (create_smooth_gradient_test, (400, 60))),  # Smaller for quick test
+            ("color_patches", (create_color_patches, (60, 8))),
         ]
     },
     "02_gradients": {
         "description": "📊 Gradient Tests - Shows banding reduction",
         "tests": [
-            ("hue_sweep_full", lambda: create_hue_sweep(600, 100, saturation=1.0, value=1.0)),
-            ("hue_sweep_desaturated", lambda: create_hue_sweep(600, 100, saturation=0.5, value=1.0)),
-            ("saturation_gradient_red", lambda: create_saturation_gradient(600, 100, hue=0.0, value=1.0)),
-            ("saturation_gradient_green", lambda: create_saturation_gradient(600, 100, hue=0.33, value=1.0)),
-            ("saturation_gradient_blue", lambda: create_saturation_gradient(600, 100, hue=0.66, value=1.0)),
-            ("value_gradient_red", lambda: create_value_gradient(600, 100, hue=0.0, saturation=1.0)),
-            ("value_gradient_green", lambda: create_value_gradient(600, 100, hue=0.33, saturation=1.0)),
-            ("value_gradient_blue", lambda: create_value_gradient(600, 100, hue=0.66, saturation=1.0)),
+            ("hue_sweep_full", (create_hue_sweep, (600, 100, 1.0, 1.0))),
+            ("hue_sweep_desaturated", (create_hue_sweep, (600, 100, 0.5, 1.0))),
+            ("saturation_gradient_red", (create_saturation_gradient, (600, 100, 0.0, 1.0))),
+            ("saturation_gradient_green", (create_saturation_gradient, (600, 100, 0.33, 1.0))),
+            ("saturation_gradient_blue", (create_saturation_gradient, (600, 100, 0.66, 1.0))),
+            ("value_gradient_red", (create_value_gradient, (600, 100, 0.0, 1.0))),
+            ("value_gradient_green", (create_value_gradient, (600, 100, 0.33, 1.0))),
+            ("value_gradient_blue", (create_value_gradient, (600, 100, 0.66, 1.0))),
         ]
     },
     "03_color_accuracy": {
         "description": "🎨 Color Accuracy - Discrete color reproduction",
         "tests": [
-            ("laser_palette", lambda: create_laser_palette_test(patch_size=80, margin=5)),
-            ("skin_tones", lambda: create_skin_tone_patches(patch_size=80, margin=10)),
-            ("color_patches_full", lambda: create_color_patches(patch_size=80, margin=10)),
+            ("laser_palette", (create_laser_palette_test, (80, 5))),
+            ("skin_tones", (create_skin_tone_patches, (80, 10))),
+            ("color_patches_full", (create_color_patches, (80, 10))),
         ]
     },
     "04_advanced": {
         "description": "🔬 Advanced Tests - Gamut and complex patterns",
         "tests": [
-            ("hsv_colorspace", lambda: create_hsv_color_space(size=400)),  # Hue/Sat at full brightness
-            ("hsv_value_ramp", lambda: create_hsv_value_ramp(size=400)),  # Value ramp to black
-            ("radial_white_red", lambda: create_radial_gradient(300, 300, (255, 255, 255), (255, 0, 0))),
-            ("radial_black_yellow", lambda: create_radial_gradient(300, 300, (0, 0, 0), (255, 255, 0))),
-            ("radial_blue_green", lambda: create_radial_gradient(300, 300, (0, 0, 255), (0, 255, 0))),
+            ("hsv_colorspace", (create_hsv_color_space, (400,))),  # Hue/Sat at full brightness
+            ("hsv_value_ramp", (create_hsv_value_ramp, (400,))),  # Value ramp to black
+            ("radial_white_red", (create_radial_gradient, (300, 300, (255, 255, 255), (255, 0, 0)))),
+            ("radial_black_yellow", (create_radial_gradient, (300, 300, (0, 0, 0), (255, 255, 0)))),
+            ("radial_blue_green", (create_radial_gradient, (300, 300, (0, 0, 255), (0, 255, 0)))),
         ]
     }
 }
 
 
+@lru_cache(maxsize=None)
+def _joined(*parts):
+    """os.path.join, memoized for paths that are rebuilt on every run."""
+    return os.path.join(*parts)
+
+
 def create_directory_structure(base_dir="tests"):
     """
     Create organized test directory structure.
@@ -76,30 +89,66 @@ def create_directory_structure(base_dir="tests"):
         Dictionary mapping category to paths
     """
     structure = {}
+    directories = {base_dir}
+
+    # Components are plain names, so the paths are built with f-strings
+    # around os.sep instead of a full os.path.join per directory
+    sep = os.sep
 
     for category in TEST_CATEGORIES.keys():
         cat_path = os.path.join(base_dir, category)
+        svg_base = f"{cat_path}{sep}svg_for_laser"
         structure[category] = {
             'base': cat_path,
-            'input': os.path.join(cat_path, 'input'),
+            'input': f"{cat_path}{sep}input",
             'svg': {
-                'original': os.path.join(cat_path, 'svg_for_laser', 'original'),
-                'retinex_floyd': os.path.join(cat_path, 'svg_for_laser', 'retinex_floyd'),
-                'retinex_atkinson': os.path.join(cat_path, 'svg_for_laser', 'retinex_atkinson'),
+                'original': f"{svg_base}{sep}original",
+                'retinex_floyd': f"{svg_base}{sep}retinex_floyd",
+                'retinex_atkinson': f"{svg_base}{sep}retinex_atkinson",
             },
-            'previews': os.path.join(cat_path, 'previews'),
+            'previews': f"{cat_path}{sep}previews",
         }
 
-        # Create all directories
-        os.makedirs(structure[category]['input'], exist_ok=True)
-        os.makedirs(structure[category]['svg']['original'], exist_ok=True)
-        os.makedirs(structure[category]['svg']['retinex_floyd'], exist_ok=True)
-        os.makedirs(structure[category]['svg']['retinex_atkinson'], exist_ok=True)
-        os.makedirs(structure[category]['previews'], exist_ok=True)
+        directories.update([
+            cat_path,
+            svg_base,
+            structure[category]['input'],
+            *structure[category]['svg'].values(),
+            structure[category]['previews'],
+        ])
+
+    # Create all directories, parents first, with one mkdir each instead of
+    # a makedirs stat walk per leaf; only a missing base_dir parent falls back
+    for path in sorted(directories, key=lambda p: p.count(os.sep)):
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            os.makedirs(path, exist_ok=True)
 
     return structure
 
 
+# Per-input-directory record of which generator call produced each pattern
+MANIFEST_NAME = ".manifest.json"
+
+
+def _pattern_key(generator):
+    """Digest of a (function, args) generator, used to spot changed test definitions."""
+    func, args = generator
+    return hashlib.blake2b(repr((func.__name__, args)).encode(), digest_size=8).hexdigest()
+
+
+def _load_manifest(input_dir):
+    """Read an input directory's manifest; missing or unreadable means empty."""
+    try:
+        with open(_joined(input_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
 def generate_test_patterns(base_dir="tests"):
     """
     Generate all test patterns organized by category.
@@ -117,31 +166,65 @@ def generate_test_patterns(base_dir="tests"):
     structure = create_directory_structure(base_dir)
     print("   ✓ Created organized test directories\n")
 
-    # Generate test patterns
+    # Generate test patterns. A pattern is skipped when its file exists, the
+    # manifest says the same generator call produced it, and it is newer than
+    # the generator code.
+    code_mtime = max(os.stat(__file__).st_mtime, os.stat(patterns_module.__file__).st_mtime)
+
     generated = {}
+    manifests = {}
+    reports = {}  # filepath -> (width, height, file bytes, up to date)
+    jobs = []
 
     for category, info in TEST_CATEGORIES.items():
-        print(f"{info['description']}")
-        print("-" * 70)
-
         generated[category] = []
         input_dir = structure[category]['input']
+        manifest = manifests[input_dir] = _load_manifest(input_dir)
+
+        # One directory scan for the stats of every existing pattern
+        existing = {entry.name: entry.stat() for entry in os.scandir(input_dir) if entry.is_file()}
 
-        for test_name, generator_func in info['tests']:
+        for test_name, generator in info['tests']:
             filename = f"{test_name}.png"
-            filepath = os.path.join(input_dir, filename)
+            filepath = f"{input_dir}{os.sep}{filename}"
+            generated[category].append((test_name, filepath))
 
-            # Generate the test pattern
-            img = generator_func()
-            img.save(filepath)
+            key = _pattern_key(generator)
+            entry = manifest.get(filename)
+            stat = existing.get(filename)
+            if entry and entry.get('key') == key and stat and stat.st_mtime > code_mtime:
+                width, height = entry['size']
+                reports[filepath] = (width, height, stat.st_size, True)
+                continue
 
-            generated[category].append((test_name, filepath))
+            manifest[filename] = {'key': key}
+            jobs.append((generator, filepath))
+
+    # Patterns are independent: generate and encode them across processes
+    if jobs:
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(save_pattern, *zip(*jobs))
 
-            # Get image dimensions for display
-            width, height = img.size
-            file_size = os.path.getsize(filepath) / 1024  # KB
+            # The encoded length comes back from the worker, so no stat is needed
+            for (generator, filepath), (width, height, file_bytes) in zip(jobs, results):
+                input_dir, filename = os.path.split(filepath)
+                manifests[input_dir][filename]['size'] = [width, height]
+                reports[filepath] = (width, height, file_bytes, False)
 
-            print(f"  ✓ {test_name:30s} ({width}x{height}, {file_size:.1f}KB)")
+        for input_dir, manifest in manifests.items():
+            Path(_joined(input_dir, MANIFEST_NAME)).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+    # Report in category order
+    for category, info in TEST_CATEGORIES.items():
+        print(f"{info['description']}")
+        print("-" * 70)
+
+        for test_name, filepath in generated[category]:
+            width, height, file_bytes, up_to_date = reports[filepath]
+            file_size = file_bytes / 1024  # KB
+            note = " (up to date)" if up_to_date else ""
+
+            print(f"  ✓ {test_name:30s} ({width}x{height}, {file_size:.1f}KB){note}")
 
         print()
 
@@ -150,132 +233,162 @@ def generate_test_patterns(base_dir="tests"):
 
     print("=" * 70)
     print(f"✅ Generated {total_tests} test patterns in {len(TEST_CATEGORIES)} categories")
+    if len(jobs) < total_tests:
+        print(f"   ({total_tests - len(jobs)} were already up to date and left as is)")
     print("=" * 70)
     print()
 
     return generated, structure
 
 
+def category_readme_text(category, info):
+    """Text of the README for a test category, explaining what to test."""
+
+    parts = []
+    parts.append("=" * 70 + "\n")
+    parts.append(f"{category.upper()} - {info['description']}\n")
+    parts.append("=" * 70 + "\n\n")
+
+    parts.append("DIRECTORY STRUCTURE:\n")
+    parts.append("-" * 70 + "\n")
+    parts.append("  input/                  Source test images\n")
+    parts.append("  svg_for_laser/          SVG files to load into LightBurn\n")
+    parts.append("    ├── original/         Original nearest-color algorithm\n")
+    parts.append("    ├── retinex_floyd/    Retinex + Floyd-Steinberg dithering\n")
+    parts.append("    └── retinex_atkinson/ Retinex + Atkinson dithering\n")
+    parts.append("  previews/               Visual comparisons (for reference)\n\n")
+
+    parts.append("HOW TO TEST:\n")
+    parts.append("-" * 70 + "\n")
+    parts.append("1. Pick a test pattern from svg_for_laser/\n")
+    parts.append("2. Load the SVG file into LightBurn\n")
+    parts.append("3. Engrave it on stainless steel\n")
+    parts.append("4. Compare results from all three algorithms\n\n")
+
+    if category == "01_quick_start":
+        parts.append("RECOMMENDATION:\n")
+        parts.append("-" * 70 + "\n")
+        parts.append("START WITH THESE FILES:\n\n")
+        parts.append("  1. grayscale_gradient\n")
+        parts.append("     - Shows smooth grayscale reproduction\n")
+        parts.append("     - Easy to see banding vs smooth transitions\n")
+        parts.append("     - Fast to engrave (~2-3 minutes)\n\n")
+        parts.append("  2. smooth_gradients\n")
+        parts.append("     - Shows color gradient smoothness\n")
+        parts.append("     - Reveals banding in original vs dithered\n")
+        parts.append("     - Medium engrave time (~5-7 minutes)\n\n")
+        parts.append("  3. color_patches\n")
+        parts.append("     - Shows discrete color accuracy\n")
+        parts.append("     - Compare color reproduction quality\n")
+        parts.append("     - Fast to engrave (~2-3 minutes)\n\n")
+        parts.append("EXPECTED RESULTS:\n")
+        parts.append("  - original/           : Hard color transitions, visible banding\n")
+        parts.append("  - retinex_floyd/      : Smooth gradients, richer colors\n")
+        parts.append("  - retinex_atkinson/   : Sharp details, good gradients\n\n")
+
+    parts.append(f"TEST PATTERNS IN THIS CATEGORY: {len(info['tests'])}\n")
+    for idx, (test_name, _) in enumerate(info['tests'], 1):
+        parts.append(f"  {idx}. {test_name}\n")
+
+    parts.append("\n")
+
+    return "".join(parts)
+
+
 def create_category_readme(category, info, cat_path):
     """Create a README for each test category explaining what to test."""
+    Path(_joined(cat_path, "README.txt")).write_text(category_readme_text(category, info))
 
-    readme_path = os.path.join(cat_path, "README.txt")
-
-    with open(readme_path, 'w') as f:
-        f.write("=" * 70 + "\n")
-        f.write(f"{category.upper()} - {info['description']}\n")
-        f.write("=" * 70 + "\n\n")
-
-        f.write("DIRECTORY STRUCTURE:\n")
-        f.write("-" * 70 + "\n")
-        f.write("  input/                  Source test images\n")
-        f.write("  svg_for_laser/          SVG files to load into LightBurn\n")
-        f.write("    ├── original/         Original nearest-color algorithm\n")
-        f.write("    ├── retinex_floyd/    Retinex + Floyd-Steinberg dithering\n")
-        f.write("    └── retinex_atkinson/ Retinex + Atkinson dithering\n")
-        f.write("  previews/               Visual comparisons (for reference)\n\n")
-
-        f.write("HOW TO TEST:\n")
-        f.write("-" * 70 + "\n")
-        f.write("1. Pick a test pattern from svg_for_laser/\n")
-        f.write("2. Load the SVG file into LightBurn\n")
-        f.write("3. Engrave it on stainless steel\n")
-        f.write("4. Compare results from all three algorithms\n\n")
-
-        if category == "01_quick_start":
-            f.write("RECOMMENDATION:\n")
-            f.write("-" * 70 + "\n")
-            f.write("START WITH THESE FILES:\n\n")
-            f.write("  1. grayscale_gradient\n")
-            f.write("     - Shows smooth grayscale reproduction\n")
-            f.write("     - Easy to see banding vs smooth transitions\n")
-            f.write("     - Fast to engrave (~2-3 minutes)\n\n")
-            f.write("  2. smooth_gradients\n")
-            f.write("     - Shows color gradient smoothness\n")
-            f.write("     - Reveals banding in original vs dithered\n")
-            f.write("     - Medium engrave time (~5-7 minutes)\n\n")
-            f.write("  3. color_patches\n")
-            f.write("     - Shows discrete color accuracy\n")
-            f.write("     - Compare color reproduction quality\n")
-            f.write("     - Fast to engrave (~2-3 minutes)\n\n")
-            f.write("EXPECTED RESULTS:\n")
-            f.write("  - original/           : Hard color transitions, visible banding\n")
-            f.write("  - retinex_floyd/      : Smooth gradients, richer colors\n")
-            f.write("  - retinex_atkinson/   : Sharp details, good gradients\n\n")
-
-        f.write(f"TEST PATTERNS IN THIS CATEGORY: {len(info['tests'])}\n")
-        for idx, (test_name, _) in enumerate(info['tests'], 1):
-            f.write(f"  {idx}. {test_name}\n")
-
-        f.write("\n")
 
+def master_readme_text():
+    """Text of the master README explaining the entire test suite."""
 
-def create_master_readme(base_dir, structure):
-    """Create master README explaining the entire test suite."""
+    parts = []
+    parts.append("=" * 70 + "\n")
+    parts.append("MOPA LASER COLOR REPRODUCTION - TEST SUITE\n")
+    parts.append("=" * 70 + "\n\n")
 
-    readme_path = os.path.join(base_dir, "README.txt")
+    parts.append("This organized test suite helps you evaluate the Retinex-enhanced\n")
+    parts.append("color reproduction algorithm compared to the original approach.\n\n")
 
-    with open(readme_path, 'w') as f:
-        f.write("=" * 70 + "\n")
-        f.write("MOPA LASER COLOR REPRODUCTION - TEST SUITE\n")
-        f.write("=" * 70 + "\n\n")
+    parts.append("🚀 QUICK START:\n")
+    parts.append("-" * 70 + "\n")
+    parts.append("1. Go to:  01_quick_start/svg_for_laser/\n")
+    parts.append("2. Pick:   grayscale_gradient.svg from any algorithm folder\n")
+    parts.append("3. Load:   Into LightBurn\n")
+    parts.append("4. Engrave: On stainless steel\n")
+    parts.append("5. Compare: Engrave the same pattern from all three folders\n\n")
 
-        f.write("This organized test suite helps you evaluate the Retinex-enhanced\n")
-        f.write("color reproduction algorithm compared to the original approach.\n\n")
+    parts.append("📁 DIRECTORY ORGANIZATION:\n")
+    parts.append("-" * 70 + "\n\n")
 
-        f.write("🚀 QUICK START:\n")
-        f.write("-" * 70 + "\n")
-        f.write("1. Go to:  01_quick_start/svg_for_laser/\n")
-        f.write("2. Pick:   grayscale_gradient.svg from any algorithm folder\n")
-        f.write("3. Load:   Into LightBurn\n")
-        f.write("4. Engrave: On stainless steel\n")
-        f.write("5. Compare: Engrave the same pattern from all three folders\n\n")
+    for category, info in TEST_CATEGORIES.items():
+        parts.append(f"{category}/\n")
+        parts.append(f"  {info['description']}\n")
+        parts.append(f"  Tests: {len(info['tests'])}\n")
+        parts.append(f"  See {category}/README.txt for details\n\n")
+
+    parts.append("\n")
+    parts.append("🎯 WHAT TO LOOK FOR:\n")
+    parts.append("-" * 70 + "\n")
+    parts.append("Original Algorithm:\n")
+    parts.append("  • Sharp color transitions (banding)\n")
+    parts.append("  • Limited color palette (10 discrete colors)\n")
+    parts.append("  • Loss of subtle gradients\n\n")
+
+    parts.append("Retinex + Floyd-Steinberg:\n")
+    parts.append("  • Smooth gradients with no banding\n")
+    parts.append("  • 2-3x more perceived colors through dithering\n")
+    parts.append("  • Best for photos and smooth color transitions\n\n")
+
+    parts.append("Retinex + Atkinson:\n")
+    parts.append("  • Sharp detail preservation\n")
+    parts.append("  • Good gradient reproduction\n")
+    parts.append("  • Best for logos, text, and line art\n\n")
+
+    parts.append("\n")
+    parts.append("⏱️  ESTIMATED ENGRAVE TIMES (per test pattern):\n")
+    parts.append("-" * 70 + "\n")
+    parts.append("  Quick start tests:    2-7 minutes each\n")
+    parts.append("  Gradient tests:       2-5 minutes each\n")
+    parts.append("  Color accuracy:       2-4 minutes each\n")
+    parts.append("  Advanced tests:       5-10 minutes each\n\n")
+
+    parts.append("Note: Times vary based on image size and laser settings\n\n")
+
+    parts.append("\n")
+    parts.append("💡 RECOMMENDATION:\n")
+    parts.append("-" * 70 + "\n")
+    parts.append("Start with 01_quick_start/ to quickly see the improvements.\n")
+    parts.append("If you like what you see, try tests from other categories.\n\n")
+
+    parts.append("The 'previews/' folders contain PNG images showing what the\n")
+    parts.append("dithered output looks like, so you can preview before engraving.\n\n")
+
+    return "".join(parts)
 
-        f.write("📁 DIRECTORY ORGANIZATION:\n")
-        f.write("-" * 70 + "\n\n")
 
+def create_master_readme(base_dir, structure):
+    """Create master README explaining the entire test suite."""
+    Path(_joined(base_dir, "README.txt")).write_text(master_readme_text())
+
+
+def write_all_readmes(base_dir, structure):
+    """
+    Create the master README and every category README.
+
+    The small file writes are issued together on a thread pool (they are
+    I/O bound), one create_*_readme call per file.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(create_master_readme, base_dir, structure)]
         for category, info in TEST_CATEGORIES.items():
-            f.write(f"{category}/\n")
-            f.write(f"  {info['description']}\n")
-            f.write(f"  Tests: {len(info['tests'])}\n")
-            f.write(f"  See {category}/README.txt for details\n\n")
-
-        f.write("\n")
-        f.write("🎯 WHAT TO LOOK FOR:\n")
-        f.write("-" * 70 + "\n")
-        f.write("Original Algorithm:\n")
-        f.write("  • Sharp color transitions (banding)\n")
-        f.write("  • Limited color palette (10 discrete colors)\n")
-        f.write("  • Loss of subtle gradients\n\n")
-
-        f.write("Retinex + Floyd-Steinberg:\n")
-        f.write("  • Smooth gradients with no banding\n")
-        f.write("  • 2-3x more perceived colors through dithering\n")
-        f.write("  • Best for photos and smooth color transitions\n\n")
-
-        f.write("Retinex + Atkinson:\n")
-        f.write("  • Sharp detail preservation\n")
-        f.write("  • Good gradient reproduction\n")
-        f.write("  • Best for logos, text, and line art\n\n")
-
-        f.write("\n")
-        f.write("⏱️  ESTIMATED ENGRAVE TIMES (per test pattern):\n")
-        f.write("-" * 70 + "\n")
-        f.write("  Quick start tests:    2-7 minutes each\n")
-        f.write("  Gradient tests:       2-5 minutes each\n")
-        f.write("  Color accuracy:       2-4 minutes each\n")
-        f.write("  Advanced tests:       5-10 minutes each\n\n")
-
-        f.write("Note: Times vary based on image size and laser settings\n\n")
-
-        f.write("\n")
-        f.write("💡 RECOMMENDATION:\n")
-        f.write("-" * 70 + "\n")
-        f.write("Start with 01_quick_start/ to quickly see the improvements.\n")
-        f.write("If you like what you see, try tests from other categories.\n\n")
-
-        f.write("The 'previews/' folders contain PNG images showing what the\n")
-        f.write("dithered output looks like, so you can preview before engraving.\n\n")
+            futures.append(executor.submit(
+                create_category_readme, category, info, structure[category]['base']))
+
+        # result() surfaces any write error here
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
@@ -283,14 +396,15 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         base_dir = sys.argv[1]
 
+    if not PILLOW_SIMD:
+        print("Tip: install pillow-simd in place of Pillow for faster image encoding\n")
+
     # Generate test patterns
     generated, structure = generate_test_patterns(base_dir)
 
     # Create README files
     print("📝 Creating documentation...")
-    create_master_readme(base_dir, structure)
-    for category, info in TEST_CATEGORIES.items():
-        create_category_readme(category, info, structure[category]['base'])
+    write_all_readmes(base_dir, structure)
     print("   ✓ Created README files\n")
 
     # Summary
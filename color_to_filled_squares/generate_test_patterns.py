@@ -11,14 +11,90 @@ This script creates standard test charts used in color science and printing:
 
 The output images can be processed with both the original and Retinex-enhanced
 algorithms to compare color reproduction quality.
+
+Pillow-SIMD (pip install pillow-simd, in place of Pillow) is a drop-in
+replacement with SIMD-accelerated kernels that speeds up image encoding.
 """
 
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
-import colorsys
+import PIL
+from PIL import Image
+import io
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, wraps
+
+
+# Pillow-SIMD releases carry a ".postN" suffix on the Pillow version they track
+PILLOW_SIMD = ".post" in PIL.__version__
+
+
+def _memoized_pattern(build_array):
+    """
+    Memoize a deterministic pattern generator that builds a NumPy array.
+
+    The array is cached read-only (keyed on the arguments, which must be
+    hashable) and every call wraps it in a new PIL Image, so callers can
+    still modify the image they get back.
+    """
+    @lru_cache(maxsize=64)
+    def cached(*args, **kwargs):
+        arr = build_array(*args, **kwargs)
+        arr.flags.writeable = False
+        return arr
+
+    @wraps(build_array)
+    def generator(*args, **kwargs):
+        return Image.fromarray(cached(*args, **kwargs))
+
+    generator.cache_clear = cached.cache_clear
+    return generator
+
+
+def _hsv_to_rgb_np(h, s, v):
+    """
+    Vectorized colorsys.hsv_to_rgb over arrays of equal shape.
+
+    Args:
+        h, s, v: float arrays with values in 0.0-1.0
+
+    Returns:
+        uint8 array of shape h.shape + (3,), truncated like int(c * 255)
+    """
+    h6 = h * 6.0
+    i = h6.astype(np.int32)
+    f = h6 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i % 6
+
+    # One (r, g, b) candidate per sextant of the hue circle
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+
+    return (np.stack([r, g, b], axis=-1) * 255).astype(np.uint8)
 
 
+def _linear_ramp(steps, start_color, end_color):
+    """
+    Colors of a linear gradient, one per step, in integer arithmetic.
+
+    Step i gets start + (end - start) * i // steps per channel, i.e. the
+    exact floor of the blend at t = i / steps.
+
+    Returns:
+        uint8 array (steps, 3)
+    """
+    start = np.asarray(start_color, dtype=np.int32)
+    delta = np.asarray(end_color, dtype=np.int32) - start
+    idx = np.arange(steps, dtype=np.int32)[:, None]
+
+    return (start + (delta * idx) // steps).astype(np.uint8)
+
+
+@_memoized_pattern
 def create_linear_gradient(width, height, start_color, end_color, vertical=False):
     """
     Create a smooth linear gradient between two colors.
@@ -32,26 +108,18 @@ def create_linear_gradient(width, height, start_color, end_color, vertical=False
     Returns:
         PIL Image
     """
-    img = Image.new('RGB', (width, height))
-    draw = ImageDraw.Draw(img)
-
-    start = np.array(start_color, dtype=float)
-    end = np.array(end_color, dtype=float)
+    # One color per row/column, blended for all of them at once
+    ramp = _linear_ramp(height if vertical else width, start_color, end_color)
 
     if vertical:
-        for y in range(height):
-            t = y / height
-            color = tuple((start * (1 - t) + end * t).astype(int))
-            draw.line([(0, y), (width, y)], fill=color)
+        arr = np.broadcast_to(ramp[:, None, :], (height, width, 3))
     else:
-        for x in range(width):
-            t = x / width
-            color = tuple((start * (1 - t) + end * t).astype(int))
-            draw.line([(x, 0), (x, height)], fill=color)
+        arr = np.broadcast_to(ramp[None, :, :], (height, width, 3))
 
-    return img
+    return arr
 
 
+@_memoized_pattern
 def create_hue_sweep(width, height, saturation=1.0, value=1.0):
     """
     Create a full hue sweep (0-360 degrees) at constant saturation and value.
@@ -64,19 +132,13 @@ def create_hue_sweep(width, height, saturation=1.0, value=1.0):
     Returns:
         PIL Image
     """
-    img = Image.new('RGB', (width, height))
-    pixels = img.load()
-
-    for x in range(width):
-        hue = x / width  # 0.0 to 1.0
-        r, g, b = colorsys.hsv_to_rgb(hue, saturation, value)
-        color = (int(r * 255), int(g * 255), int(b * 255))
-        for y in range(height):
-            pixels[x, y] = color
+    hue = np.arange(width) / width  # 0.0 to 1.0
+    row = _hsv_to_rgb_np(hue, np.full_like(hue, saturation), np.full_like(hue, value))
 
-    return img
+    return np.broadcast_to(row, (height, width, 3))
 
 
+@_memoized_pattern
 def create_saturation_gradient(width, height, hue=0.0, value=1.0):
     """
     Create a saturation gradient from gray to full color at a specific hue.
@@ -89,19 +151,13 @@ def create_saturation_gradient(width, height, hue=0.0, value=1.0):
     Returns:
         PIL Image
     """
-    img = Image.new('RGB', (width, height))
-    pixels = img.load()
+    saturation = np.arange(width) / width
+    row = _hsv_to_rgb_np(np.full_like(saturation, hue), saturation, np.full_like(saturation, value))
 
-    for x in range(width):
-        saturation = x / width
-        r, g, b = colorsys.hsv_to_rgb(hue, saturation, value)
-        color = (int(r * 255), int(g * 255), int(b * 255))
-        for y in range(height):
-            pixels[x, y] = color
-
-    return img
+    return np.broadcast_to(row, (height, width, 3))
 
 
+@_memoized_pattern
 def create_value_gradient(width, height, hue=0.0, saturation=1.0):
     """
     Create a value/brightness gradient from black to full brightness.
@@ -114,19 +170,13 @@ def create_value_gradient(width, height, hue=0.0, saturation=1.0):
     Returns:
         PIL Image
     """
-    img = Image.new('RGB', (width, height))
-    pixels = img.load()
-
-    for x in range(width):
-        value = x / width
-        r, g, b = colorsys.hsv_to_rgb(hue, saturation, value)
-        color = (int(r * 255), int(g * 255), int(b * 255))
-        for y in range(height):
-            pixels[x, y] = color
+    value = np.arange(width) / width
+    row = _hsv_to_rgb_np(np.full_like(value, hue), np.full_like(value, saturation), value)
 
-    return img
+    return np.broadcast_to(row, (height, width, 3))
 
 
+@_memoized_pattern
 def create_radial_gradient(width, height, center_color, edge_color):
     """
     Create a radial gradient from center to edges.
@@ -139,24 +189,68 @@ def create_radial_gradient(width, height, center_color, edge_color):
     Returns:
         PIL Image
     """
-    img = Image.new('RGB', (width, height))
-    pixels = img.load()
-
     center_x, center_y = width / 2, height / 2
-    max_dist = np.sqrt(center_x**2 + center_y**2)
 
     center = np.array(center_color, dtype=float)
     edge = np.array(edge_color, dtype=float)
 
-    for y in range(height):
-        for x in range(width):
-            dx, dy = x - center_x, y - center_y
-            dist = np.sqrt(dx**2 + dy**2)
-            t = min(dist / max_dist, 1.0)
-            color = tuple((center * (1 - t) + edge * t).astype(int))
-            pixels[x, y] = color
-
-    return img
+    # Distance of every pixel from the center relative to the corner distance,
+    # as an (H, W, 1) blend factor. Ratio and clamp work on squared distances,
+    # leaving a single in-place sqrt over the array.
+    ys, xs = np.ogrid[0:height, 0:width]
+    dx, dy = xs - center_x, ys - center_y
+    t = dx * dx + dy * dy
+    t /= center_x**2 + center_y**2
+    np.minimum(t, 1.0, out=t)
+    t = np.sqrt(t, out=t)[..., None]
+
+    return (center * (1 - t) + edge * t).astype(np.uint8)
+
+
+# Patch chart colors, converted to uint8 arrays once at import so the
+# generators can slice-assign them without per-call conversion
+
+# Background behind the patch charts
+_BG = np.array((40, 40, 40), dtype=np.uint8)
+
+# Standard color patches (rows x columns x RGB)
+_PATCH_COLORS = np.array([
+    # Row 1: Primaries and secondaries
+    [(255, 0, 0), (255, 127, 0), (255, 255, 0), (0, 255, 0), (0, 255, 255), (0, 0, 255), (255, 0, 255)],
+    # Row 2: Desaturated versions (50% saturation)
+    [(255, 127, 127), (255, 191, 127), (255, 255, 127), (127, 255, 127), (127, 255, 255), (127, 127, 255), (255, 127, 255)],
+    # Row 3: Dark versions (50% value)
+    [(127, 0, 0), (127, 63, 0), (127, 127, 0), (0, 127, 0), (0, 127, 127), (0, 0, 127), (127, 0, 127)],
+    # Row 4: Grayscale
+    [(0, 0, 0), (32, 32, 32), (64, 64, 64), (96, 96, 96), (128, 128, 128), (192, 192, 192), (255, 255, 255)],
+], dtype=np.uint8)
+
+# Skin tones from very light to very dark (approximate Fitzpatrick scale)
+_SKIN_TONES = np.array([
+    (255, 224, 196),  # Very light
+    (255, 209, 178),  # Light
+    (241, 194, 155),  # Light-medium
+    (224, 172, 128),  # Medium
+    (198, 134, 90),   # Medium-dark
+    (141, 85, 36),    # Dark
+    (90, 49, 20),     # Very dark
+], dtype=np.uint8)
+
+# Colors from the laser settings
+_LASER_COLOR_NAMES = ["Black", "White", "Gray", "Purple", "Blue",
+                      "Green", "Yellow", "Orange", "Red", "Brown"]
+_LASER_COLORS = np.array([
+    (0, 0, 0),        # Black
+    (180, 180, 180),  # White
+    (128, 128, 128),  # Gray
+    (128, 0, 128),    # Purple
+    (0, 0, 255),      # Blue
+    (0, 224, 0),      # Green
+    (208, 208, 0),    # Yellow
+    (255, 128, 0),    # Orange
+    (255, 0, 0),      # Red
+    (139, 69, 19),    # Brown
+], dtype=np.uint8)
 
 
 def create_color_patches(patch_size=100, margin=10):
@@ -170,34 +264,21 @@ def create_color_patches(patch_size=100, margin=10):
     Returns:
         PIL Image
     """
-    # Define standard color patches
-    colors = [
-        # Row 1: Primaries and secondaries
-        [(255, 0, 0), (255, 127, 0), (255, 255, 0), (0, 255, 0), (0, 255, 255), (0, 0, 255), (255, 0, 255)],
-        # Row 2: Desaturated versions (50% saturation)
-        [(255, 127, 127), (255, 191, 127), (255, 255, 127), (127, 255, 127), (127, 255, 255), (127, 127, 255), (255, 127, 255)],
-        # Row 3: Dark versions (50% value)
-        [(127, 0, 0), (127, 63, 0), (127, 127, 0), (0, 127, 0), (0, 127, 127), (0, 0, 127), (127, 0, 127)],
-        # Row 4: Grayscale
-        [(0, 0, 0), (32, 32, 32), (64, 64, 64), (96, 96, 96), (128, 128, 128), (192, 192, 192), (255, 255, 255)],
-    ]
-
-    rows = len(colors)
-    cols = len(colors[0])
+    rows, cols = _PATCH_COLORS.shape[:2]
 
     width = cols * patch_size + (cols + 1) * margin
     height = rows * patch_size + (rows + 1) * margin
 
-    img = Image.new('RGB', (width, height), color=(40, 40, 40))
-    draw = ImageDraw.Draw(img)
+    arr = np.full((height, width, 3), _BG)
 
-    for row_idx, row in enumerate(colors):
+    # Patches span patch_size + 1 pixels, as ImageDraw.rectangle's inclusive corners did
+    for row_idx, row in enumerate(_PATCH_COLORS):
         for col_idx, color in enumerate(row):
             x = margin + col_idx * (patch_size + margin)
             y = margin + row_idx * (patch_size + margin)
-            draw.rectangle([x, y, x + patch_size, y + patch_size], fill=color)
+            arr[y:y + patch_size + 1, x:x + patch_size + 1] = color
 
-    return img
+    return Image.fromarray(arr)
 
 
 def create_skin_tone_patches(patch_size=100, margin=10):
@@ -207,30 +288,18 @@ def create_skin_tone_patches(patch_size=100, margin=10):
     Returns:
         PIL Image
     """
-    # Skin tones from very light to very dark (approximate Fitzpatrick scale)
-    skin_tones = [
-        (255, 224, 196),  # Very light
-        (255, 209, 178),  # Light
-        (241, 194, 155),  # Light-medium
-        (224, 172, 128),  # Medium
-        (198, 134, 90),   # Medium-dark
-        (141, 85, 36),    # Dark
-        (90, 49, 20),     # Very dark
-    ]
-
-    cols = len(skin_tones)
+    cols = len(_SKIN_TONES)
     width = cols * patch_size + (cols + 1) * margin
     height = patch_size + 2 * margin
 
-    img = Image.new('RGB', (width, height), color=(40, 40, 40))
-    draw = ImageDraw.Draw(img)
+    arr = np.full((height, width, 3), _BG)
 
-    for idx, color in enumerate(skin_tones):
+    for idx, color in enumerate(_SKIN_TONES):
         x = margin + idx * (patch_size + margin)
         y = margin
-        draw.rectangle([x, y, x + patch_size, y + patch_size], fill=color)
+        arr[y:y + patch_size + 1, x:x + patch_size + 1] = color
 
-    return img
+    return Image.fromarray(arr)
 
 
 def create_laser_palette_test(patch_size=80, margin=5):
@@ -240,30 +309,15 @@ def create_laser_palette_test(patch_size=80, margin=5):
     Returns:
         PIL Image with labels
     """
-    # Colors from the laser settings
-    laser_colors = [
-        ("Black", (0, 0, 0)),
-        ("White", (180, 180, 180)),
-        ("Gray", (128, 128, 128)),
-        ("Purple", (128, 0, 128)),
-        ("Blue", (0, 0, 255)),
-        ("Green", (0, 224, 0)),
-        ("Yellow", (208, 208, 0)),
-        ("Orange", (255, 128, 0)),
-        ("Red", (255, 0, 0)),
-        ("Brown", (139, 69, 19)),
-    ]
-
     cols = 5
     rows = 2
 
     width = cols * patch_size + (cols + 1) * margin
     height = rows * (patch_size + 20) + (rows + 1) * margin
 
-    img = Image.new('RGB', (width, height), color=(40, 40, 40))
-    draw = ImageDraw.Draw(img)
+    arr = np.full((height, width, 3), _BG)
 
-    for idx, (name, color) in enumerate(laser_colors):
+    for idx, (name, color) in enumerate(zip(_LASER_COLOR_NAMES, _LASER_COLORS)):
         row = idx // cols
         col = idx % cols
 
@@ -271,14 +325,15 @@ def create_laser_palette_test(patch_size=80, margin=5):
         y = margin + row * (patch_size + 20 + margin)
 
         # Draw color patch
-        draw.rectangle([x, y, x + patch_size, y + patch_size], fill=color)
+        arr[y:y + patch_size + 1, x:x + patch_size + 1] = color
 
         # Draw label (simplified - no font needed)
         # In actual use, could add text if PIL has font access
 
-    return img
+    return Image.fromarray(arr)
 
 
+@_memoized_pattern
 def create_hsv_color_space(size=400, value=1.0):
     """
     Create a 2D visualization of HSV color space (Hue vs Saturation).
@@ -290,31 +345,27 @@ def create_hsv_color_space(size=400, value=1.0):
     Returns:
         PIL Image
     """
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-
     center = size / 2
 
-    for y in range(size):
-        for x in range(size):
-            dx = x - center
-            dy = y - center
+    ys, xs = np.ogrid[0:size, 0:size]
+    dx, dy = xs - center, ys - center
 
-            # Calculate saturation from distance to center
-            dist = np.sqrt(dx**2 + dy**2)
-            saturation = min(dist / center, 1.0)
+    # Calculate saturation from distance to center (squared, then one sqrt)
+    saturation = dx * dx + dy * dy
+    saturation /= center**2
+    np.minimum(saturation, 1.0, out=saturation)
+    np.sqrt(saturation, out=saturation)
 
-            # Calculate hue from angle
-            angle = np.arctan2(dy, dx)
-            hue = (angle + np.pi) / (2 * np.pi)
+    # Calculate hue from angle, mapped to 0-1 in place
+    hue = np.arctan2(dy, dx)
+    hue += np.pi
+    hue *= 0.5 / np.pi
 
-            # Convert to RGB
-            r, g, b = colorsys.hsv_to_rgb(hue, saturation, value)
-            pixels[x, y] = (int(r * 255), int(g * 255), int(b * 255))
-
-    return img
+    # Convert to RGB
+    return _hsv_to_rgb_np(hue, saturation, np.full_like(hue, value))
 
 
+@_memoized_pattern
 def create_hsv_value_ramp(size=400):
     """
     Create HSV color space with value ramp from full color (edge) to black (center).
@@ -326,32 +377,28 @@ def create_hsv_value_ramp(size=400):
     Returns:
         PIL Image
     """
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-
     center = size / 2
 
-    for y in range(size):
-        for x in range(size):
-            dx = x - center
-            dy = y - center
+    ys, xs = np.ogrid[0:size, 0:size]
+    dx, dy = xs - center, ys - center
 
-            # Calculate value from distance to center (inverted - center is dark)
-            dist = np.sqrt(dx**2 + dy**2)
-            value = min(dist / center, 1.0)  # 0 at center (black), 1 at edge (full color)
+    # Calculate value from distance to center (inverted - center is dark)
+    # 0 at center (black), 1 at edge (full color); squared, then one sqrt
+    value = dx * dx + dy * dy
+    value /= center**2
+    np.minimum(value, 1.0, out=value)
+    np.sqrt(value, out=value)
 
-            # Calculate hue from angle
-            angle = np.arctan2(dy, dx)
-            hue = (angle + np.pi) / (2 * np.pi)
+    # Calculate hue from angle, mapped to 0-1 in place
+    hue = np.arctan2(dy, dx)
+    hue += np.pi
+    hue *= 0.5 / np.pi
 
-            # Full saturation
-            saturation = 1.0
+    # Full saturation
+    saturation = np.ones_like(hue)
 
-            # Convert to RGB
-            r, g, b = colorsys.hsv_to_rgb(hue, saturation, value)
-            pixels[x, y] = (int(r * 255), int(g * 255), int(b * 255))
-
-    return img
+    # Convert to RGB
+    return _hsv_to_rgb_np(hue, saturation, value)
 
 
 def create_smooth_gradient_test(width=600, height=100):
@@ -374,18 +421,79 @@ def create_smooth_gradient_test(width=600, height=100):
     margin = 5
     total_height = len(tests) * (height + margin) + margin
 
-    img = Image.new('RGB', (width, total_height), color=(40, 40, 40))
+    arr = np.full((total_height, width, 3), _BG)
 
+    # Same ramp as create_linear_gradient, written straight into each stripe
     for idx, (name, start, end) in enumerate(tests):
-        gradient = create_linear_gradient(width, height, start, end)
-        img.paste(gradient, (0, margin + idx * (height + margin)))
+        y = margin + idx * (height + margin)
+        arr[y:y + height] = _linear_ramp(width, start, end)
+
+    return Image.fromarray(arr)
+
+
+# Flags for writing pattern files: O_BINARY on Windows, and O_NOATIME where
+# the platform has it (it is refused for files owned by another user)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_NOATIME = getattr(os, "O_NOATIME", 0)
+
+
+def write_png(img, path):
+    """
+    Encode an image to PNG in memory and write it with a single raw file write,
+    bypassing Python's buffered file layer.
+
+    Args:
+        img: PIL Image
+        path: Destination file path
+
+    Returns:
+        Size of the written file in bytes
+    """
+    buf = io.BytesIO()
+    # These are intermediate inputs read straight back by the converters, so
+    # spend as little time as possible in zlib (files stay lossless PNG)
+    img.save(buf, 'PNG', optimize=False, compress_level=1)
+    data = buf.getbuffer()
+
+    try:
+        fd = os.open(path, _WRITE_FLAGS | _NOATIME, 0o644)
+    except PermissionError:
+        if not _NOATIME:
+            raise
+        fd = os.open(path, _WRITE_FLAGS, 0o644)
+
+    try:
+        written = 0
+        while written < len(data):
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+
+    return len(data)
+
+
+def save_pattern(generator, path):
+    """
+    Generate one test pattern and save it. Runs in a worker process.
 
-    return img
+    Args:
+        generator: (function, args) tuple; function(*args) returns a PIL Image
+        path: Where to save the image
+
+    Returns:
+        (width, height, file size in bytes) of the saved image
+    """
+    func, args = generator
+    img = func(*args)
+    file_bytes = write_png(img, path)
+    return img.size + (file_bytes,)
 
 
 def generate_all_test_patterns(output_dir="test_patterns"):
     """
     Generate all test patterns and save them to the output directory.
+    Patterns are independent, so they are generated and encoded in parallel
+    across worker processes.
 
     Args:
         output_dir: Directory to save test pattern images
@@ -394,113 +502,77 @@ def generate_all_test_patterns(output_dir="test_patterns"):
         List of generated file paths
     """
     os.makedirs(output_dir, exist_ok=True)
-    generated_files = []
 
-    print("Generating color test patterns...")
+    # (section, filename, (function, args)) for every pattern, in report order
+    jobs = []
 
     # 1. Hue sweeps at different saturation/value levels
-    print("  - Hue sweeps...")
     for v in [1.0, 0.75, 0.5]:
         for s in [1.0, 0.75, 0.5]:
-            filename = f"hue_sweep_s{int(s*100)}_v{int(v*100)}.png"
-            path = os.path.join(output_dir, filename)
-            img = create_hue_sweep(600, 100, saturation=s, value=v)
-            img.save(path)
-            generated_files.append(path)
-            print(f"    ✓ {filename}")
+            jobs.append(("Hue sweeps", f"hue_sweep_s{int(s*100)}_v{int(v*100)}.png",
+                         (create_hue_sweep, (600, 100, s, v))))
 
     # 2. Saturation gradients for primary hues
-    print("  - Saturation gradients...")
     hues = [("red", 0.0), ("green", 0.33), ("blue", 0.66)]
     for name, hue in hues:
-        filename = f"saturation_gradient_{name}.png"
-        path = os.path.join(output_dir, filename)
-        img = create_saturation_gradient(600, 100, hue=hue, value=1.0)
-        img.save(path)
-        generated_files.append(path)
-        print(f"    ✓ {filename}")
+        jobs.append(("Saturation gradients", f"saturation_gradient_{name}.png",
+                     (create_saturation_gradient, (600, 100, hue, 1.0))))
 
     # 3. Value gradients for primary hues
-    print("  - Value gradients...")
     for name, hue in hues:
-        filename = f"value_gradient_{name}.png"
-        path = os.path.join(output_dir, filename)
-        img = create_value_gradient(600, 100, hue=hue, saturation=1.0)
-        img.save(path)
-        generated_files.append(path)
-        print(f"    ✓ {filename}")
+        jobs.append(("Value gradients", f"value_gradient_{name}.png",
+                     (create_value_gradient, (600, 100, hue, 1.0))))
 
     # 4. Grayscale gradient
-    print("  - Grayscale gradient...")
-    filename = "grayscale_gradient.png"
-    path = os.path.join(output_dir, filename)
-    img = create_linear_gradient(600, 100, (0, 0, 0), (255, 255, 255))
-    img.save(path)
-    generated_files.append(path)
-    print(f"    ✓ {filename}")
+    jobs.append(("Grayscale gradient", "grayscale_gradient.png",
+                 (create_linear_gradient, (600, 100, (0, 0, 0), (255, 255, 255)))))
 
     # 5. Radial gradients
-    print("  - Radial gradients...")
     radial_tests = [
         ("radial_white_red", (255, 255, 255), (255, 0, 0)),
         ("radial_black_yellow", (0, 0, 0), (255, 255, 0)),
         ("radial_blue_green", (0, 0, 255), (0, 255, 0)),
     ]
     for name, center, edge in radial_tests:
-        filename = f"{name}.png"
-        path = os.path.join(output_dir, filename)
-        img = create_radial_gradient(400, 400, center, edge)
-        img.save(path)
-        generated_files.append(path)
-        print(f"    ✓ {filename}")
+        jobs.append(("Radial gradients", f"{name}.png",
+                     (create_radial_gradient, (400, 400, center, edge))))
 
     # 6. Color patches
-    print("  - Color patches...")
-    filename = "color_patches.png"
-    path = os.path.join(output_dir, filename)
-    img = create_color_patches(patch_size=80, margin=10)
-    img.save(path)
-    generated_files.append(path)
-    print(f"    ✓ {filename}")
+    jobs.append(("Color patches", "color_patches.png",
+                 (create_color_patches, (80, 10))))
 
     # 7. Skin tone patches
-    print("  - Skin tone patches...")
-    filename = "skin_tones.png"
-    path = os.path.join(output_dir, filename)
-    img = create_skin_tone_patches(patch_size=80, margin=10)
-    img.save(path)
-    generated_files.append(path)
-    print(f"    ✓ {filename}")
+    jobs.append(("Skin tone patches", "skin_tones.png",
+                 (create_skin_tone_patches, (80, 10))))
 
     # 8. Laser palette
-    print("  - MOPA laser palette...")
-    filename = "laser_palette.png"
-    path = os.path.join(output_dir, filename)
-    img = create_laser_palette_test(patch_size=80, margin=5)
-    img.save(path)
-    generated_files.append(path)
-    print(f"    ✓ {filename}")
+    jobs.append(("MOPA laser palette", "laser_palette.png",
+                 (create_laser_palette_test, (80, 5))))
 
     # 9. HSV color space
-    print("  - HSV color space...")
-    filename = "hsv_colorspace.png"
-    path = os.path.join(output_dir, filename)
-    img = create_hsv_color_space(size=500)
-    img.save(path)
-    generated_files.append(path)
-    print(f"    ✓ {filename}")
+    jobs.append(("HSV color space", "hsv_colorspace.png",
+                 (create_hsv_color_space, (500,))))
 
     # 10. Smooth gradient test
-    print("  - Smooth gradient test...")
-    filename = "smooth_gradients.png"
-    path = os.path.join(output_dir, filename)
-    img = create_smooth_gradient_test(width=600, height=80)
-    img.save(path)
-    generated_files.append(path)
-    print(f"    ✓ {filename}")
+    jobs.append(("Smooth gradient test", "smooth_gradients.png",
+                 (create_smooth_gradient_test, (600, 80))))
+
+    print("Generating color test patterns...")
 
-    print(f"\n✅ Generated {len(generated_files)} test patterns in '{output_dir}/'")
-    return generated_files
+    paths = [os.path.join(output_dir, filename) for _, filename, _ in jobs]
+    with ProcessPoolExecutor() as executor:
+        # map() yields results in submission order, so the log stays in order
+        results = executor.map(save_pattern, [generator for _, _, generator in jobs], paths)
+
+        section = None
+        for (job_section, filename, _), _ in zip(jobs, results):
+            if job_section != section:
+                section = job_section
+                print(f"  - {section}...")
+            print(f"    ✓ {filename}")
+
+    print(f"\n✅ Generated {len(paths)} test patterns in '{output_dir}/'")
+    return paths
 
 
 if __name__ == "__main__":
@@ -510,6 +582,9 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         output_dir = sys.argv[1]
 
+    if not PILLOW_SIMD:
+        print("Tip: install pillow-simd in place of Pillow for faster image encoding\n")
+
     files = generate_all_test_patterns(output_dir)
 
     print("\nTest patterns ready for processing!")
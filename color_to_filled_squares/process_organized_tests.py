@@ -34,8 +34,10 @@ def process_test_pattern(input_path, output_dir, algorithm):
             input_path,
             output_svg,
             "0.25"
-        ], capture_output=True, check=True)
-        return output_svg, None
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+        preview_path = output_svg.replace('.svg', '_preview.png')
+        return output_svg, preview_path
 
     else:  # retinex algorithms
         dithering = 'floyd-steinberg' if algorithm == 'retinex_floyd' else 'atkinson'
@@ -48,7 +50,7 @@ def process_test_pattern(input_path, output_dir, algorithm):
             output_svg,
             "0.25",
             dithering
-        ], capture_output=True, check=True)
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
 
         preview_path = output_svg.replace('.svg', '_preview.png')
         return output_svg, preview_path
@@ -152,10 +154,15 @@ def process_all_tests(base_dir="tests"):
                 preview_dir = os.path.join(cat_path, 'previews')
 
                 # Process each algorithm
-                svg_original, _ = process_test_pattern(
+                svg_original, preview_original = process_test_pattern(
                     str(test_pattern), svg_dirs['original'], 'original'
                 )
 
+                # Keep the laser directory SVG-only
+                if os.path.exists(preview_original):
+                    os.rename(preview_original,
+                              os.path.join(preview_dir, f"{test_name}_original_preview.png"))
+
                 svg_floyd, preview_floyd = process_test_pattern(
                     str(test_pattern), svg_dirs['retinex_floyd'], 'retinex_floyd'
                 )
@@ -13,14 +13,38 @@ The goal is to make it trivially easy for the original author to evaluate
 the improvements without needing to understand the implementation details.
 """
 
+import hashlib
+import json
+import multiprocessing
 import os
 import sys
 import time
 import subprocess
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import shutil
 
+import color_to_squares
+import color_to_squares_retinex
+
+
+def list_test_patterns(test_dir):
+    """
+    List the PNG files in a directory from its directory entries alone.
+
+    Args:
+        test_dir: Directory containing test patterns
+
+    Returns:
+        Sorted list of test pattern file paths (empty if the directory is missing)
+    """
+    if not os.path.isdir(test_dir):
+        return []
+    with os.scandir(test_dir) as it:
+        return sorted(e.path for e in it if e.is_file() and e.name.endswith('.png'))
+
 
 def ensure_test_patterns_exist(test_dir="test_patterns"):
     """
@@ -32,42 +56,258 @@ def ensure_test_patterns_exist(test_dir="test_patterns"):
     Returns:
         List of test pattern file paths
     """
-    if not os.path.exists(test_dir) or len(list(Path(test_dir).glob("*.png"))) == 0:
+    patterns = list_test_patterns(test_dir)
+
+    if not patterns:
         print("📊 Generating test patterns...")
-        subprocess.run([sys.executable, "generate_test_patterns.py", test_dir])
+        subprocess.run([sys.executable, "generate_test_patterns.py", test_dir], check=True)
         print()
+        patterns = list_test_patterns(test_dir)
 
-    patterns = sorted(Path(test_dir).glob("*.png"))
-    return [str(p) for p in patterns]
+    return patterns
 
 
-def run_original_algorithm(input_file, output_dir):
+# Content-addressed store of algorithm outputs, keyed by input bytes, algorithm source and parameters
+CACHE_DIR = Path(".cache")
+
+
+def cache_key(input_file, algo_tag, module, scale, dither):
     """
-    Run the original color_to_squares.py algorithm.
+    Hash an input image together with everything that affects its output.
 
     Args:
         input_file: Path to input image
+        algo_tag: Name of the algorithm
+        module: Algorithm module; its ALGORITHM_VERSION and source are hashed,
+            so editing the code invalidates stamps and cached outputs
+        scale: Square size in mm
+        dither: Dithering method (None for the original algorithm)
+
+    Returns:
+        Hex digest identifying the output
+    """
+    with open(input_file, 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=20)
+    with open(module.__file__, 'rb') as f:
+        digest.update(f.read())
+    digest.update(f"{algo_tag}|{module.ALGORITHM_VERSION}|{scale}|{dither}".encode())
+    return digest.hexdigest()
+
+
+def restore_from_cache(key, outputs):
+    """
+    Copy cached outputs into place.
+
+    Args:
+        key: Cache key from cache_key()
+        outputs: Dictionary of cache suffix -> expected output path
+
+    Returns:
+        True if every output was found in the cache
+    """
+    cached = {suffix: CACHE_DIR / (key + suffix) for suffix in outputs}
+    if not all(path.exists() for path in cached.values()):
+        return False
+    for suffix, path in outputs.items():
+        shutil.copyfile(cached[suffix], path)
+    return True
+
+
+def store_in_cache(key, outputs):
+    """
+    Save freshly generated outputs to the cache.
+
+    Args:
+        key: Cache key from cache_key()
+        outputs: Dictionary of cache suffix -> generated output path
+    """
+    CACHE_DIR.mkdir(exist_ok=True)
+    for suffix, path in outputs.items():
+        if not os.path.exists(path):
+            continue
+        # Copy then rename, so a concurrent reader never sees a partial file
+        cached = CACHE_DIR / (key + suffix)
+        partial = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        shutil.copyfile(path, partial)
+        partial.replace(cached)
+
+
+def stamp_path(output_path):
+    """
+    Path of the stamp file kept next to an output.
+
+    Args:
+        output_path: Output file the stamp belongs to
+
+    Returns:
+        Path of the stamp file
+    """
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.name + ".stamp")
+
+
+def stamp_matches(key, output_paths):
+    """
+    Check the stamp left next to a run's outputs against its cache key.
+
+    A match means the outputs were produced from identical input content,
+    algorithm source and parameters, even if a file has since been touched; the outputs
+    are touched in turn so the cheaper mtime check passes next time.
+
+    Args:
+        key: Cache key from cache_key()
+        output_paths: Output files the algorithm produces (first one owns the stamp)
+
+    Returns:
+        True if the stamp matches and every output exists
+    """
+    try:
+        with open(stamp_path(output_paths[0])) as f:
+            if f.read() != key:
+                return False
+    except OSError:
+        return False
+
+    if not all(os.path.exists(path) for path in output_paths):
+        return False
+    for path in output_paths:
+        os.utime(path)
+    return True
+
+
+def write_stamp(key, output_paths):
+    """
+    Record the cache key the outputs were produced from.
+
+    Args:
+        key: Cache key from cache_key() (covers input hash and algorithm source)
+        output_paths: Output files the algorithm produces (first one owns the stamp)
+
+    Raises:
+        RuntimeError: If any output is missing or empty; no stamp is written
+    """
+    check_outputs(output_paths, key)
+    with open(stamp_path(output_paths[0]), 'w') as f:
+        f.write(key)
+
+
+def discard_outputs(output_paths):
+    """
+    Delete stale outputs so a failed run can't leave the old ones looking valid.
+
+    Args:
+        output_paths: Output files the algorithm produces
+    """
+    for path in output_paths:
+        Path(path).unlink(missing_ok=True)
+
+
+def check_outputs(output_paths, source):
+    """
+    Confirm that an in-process run actually wrote its outputs.
+
+    The algorithms report errors by printing them rather than raising, so a
+    missing or empty output file is the only sign that a run failed.
+
+    Args:
+        output_paths: Output files the algorithm produces
+        source: Input image (or cache key) the outputs came from, for the error message
+
+    Raises:
+        RuntimeError: If any output is missing or empty
+    """
+    for path in output_paths:
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            raise RuntimeError(f"{source}: no output written to {path}")
+
+
+def is_up_to_date(output_paths, input_file, module):
+    """
+    Make-style check that outputs are newer than their input and algorithm.
+
+    Args:
+        output_paths: Output files the algorithm produces
+        input_file: Path to input image
+        module: Algorithm module whose source file is a dependency
+
+    Returns:
+        True if every output exists and is newer than both dependencies
+    """
+    src_mtime = max(os.path.getmtime(input_file), os.path.getmtime(module.__file__))
+    return all(
+        os.path.exists(path) and os.path.getmtime(path) > src_mtime
+        for path in output_paths
+    )
+
+
+def output_svg_path(output_dir, basename, kind):
+    """
+    Path of the SVG an algorithm variant writes for a test pattern.
+
+    Args:
         output_dir: Directory for output files
+        basename: Test pattern name without extension
+        kind: "original" or a Retinex dithering method
 
     Returns:
         Path to output SVG file
     """
-    basename = Path(input_file).stem
-    output_svg = os.path.join(output_dir, f"{basename}_original.svg")
+    suffix = "original" if kind == "original" else f"retinex_{kind}"
+    return Path(output_dir) / f"{basename}_{suffix}.svg"
+
+
+def preview_path_for(output_svg):
+    """
+    Path of the preview PNG an algorithm writes next to its SVG.
+
+    Args:
+        output_svg: Path to output SVG file
+
+    Returns:
+        Path to preview PNG file
+    """
+    return output_svg.with_name(output_svg.stem + "_preview.png")
+
+
+def run_original_algorithm(input_file, output_dir, output_svg=None):
+    """
+    Run the original color_to_squares.py algorithm.
+
+    Args:
+        input_file: Path to input image
+        output_dir: Directory for output files
+        output_svg: Precomputed output path (derived from input_file if omitted)
+
+    Returns:
+        Tuple of (SVG path, preview PNG path)
+    """
+    if output_svg is None:
+        output_svg = output_svg_path(output_dir, Path(input_file).stem, "original")
+    output_svg = Path(output_svg)
+
+    # Preview image should be created automatically
+    preview_path = preview_path_for(output_svg)
+
+    if is_up_to_date([output_svg, preview_path], input_file, color_to_squares):
+        return output_svg, preview_path
+
+    outputs = {'.svg': output_svg, '_preview.png': preview_path}
+    key = cache_key(input_file, "original", color_to_squares, 0.25, None)
+    if stamp_matches(key, [output_svg, preview_path]):
+        return output_svg, preview_path
 
-    # Run original script
-    subprocess.run([
-        sys.executable,
-        "color_to_squares.py",
-        input_file,
-        output_svg,
-        "0.25"
-    ], capture_output=True)
+    if not restore_from_cache(key, outputs):
+        # Run original algorithm in-process
+        discard_outputs([output_svg, preview_path])
+        color_to_squares.process(input_file, str(output_svg), 0.25)
+        check_outputs([output_svg, preview_path], input_file)
+        store_in_cache(key, outputs)
+    write_stamp(key, [output_svg, preview_path])
 
-    return output_svg
+    return output_svg, preview_path
 
 
-def run_retinex_algorithm(input_file, output_dir, dithering="floyd-steinberg"):
+def run_retinex_algorithm(input_file, output_dir, dithering="floyd-steinberg", output_svg=None):
     """
     Run the Retinex-enhanced algorithm with specified dithering.
 
@@ -75,29 +315,137 @@ def run_retinex_algorithm(input_file, output_dir, dithering="floyd-steinberg"):
         input_file: Path to input image
         output_dir: Directory for output files
         dithering: "floyd-steinberg", "atkinson", or "none"
+        output_svg: Precomputed output path (derived from input_file if omitted)
 
     Returns:
         Tuple of (SVG path, preview PNG path)
     """
-    basename = Path(input_file).stem
-    output_svg = os.path.join(output_dir, f"{basename}_retinex_{dithering}.svg")
-
-    # Run Retinex script
-    subprocess.run([
-        sys.executable,
-        "color_to_squares_retinex.py",
-        input_file,
-        output_svg,
-        "0.25",
-        dithering
-    ], capture_output=True)
+    if output_svg is None:
+        output_svg = output_svg_path(output_dir, Path(input_file).stem, dithering)
+    output_svg = Path(output_svg)
 
     # Preview image should be created automatically
-    preview_path = output_svg.replace('.svg', '_preview.png')
+    preview_path = preview_path_for(output_svg)
+
+    if is_up_to_date([output_svg, preview_path], input_file, color_to_squares_retinex):
+        return output_svg, preview_path
+
+    outputs = {'.svg': output_svg, '_preview.png': preview_path}
+    key = cache_key(input_file, "retinex", color_to_squares_retinex, 0.25, dithering)
+    if stamp_matches(key, [output_svg, preview_path]):
+        return output_svg, preview_path
+
+    if not restore_from_cache(key, outputs):
+        # Run Retinex algorithm in-process
+        discard_outputs([output_svg, preview_path])
+        color_to_squares_retinex.process(input_file, str(output_svg), 0.25, dithering)
+        check_outputs([output_svg, preview_path], input_file)
+        store_in_cache(key, outputs)
+    write_stamp(key, [output_svg, preview_path])
 
     return output_svg, preview_path
 
 
+# Algorithm variants run for every test pattern, in comparison column order
+JOB_KINDS = ("original", "floyd-steinberg", "atkinson")
+
+
+def init_worker():
+    """
+    One-time setup for each pool worker.
+
+    Workers are spawned fresh and import this module, and with it both
+    algorithm modules, once at start-up; every job after that reuses them.
+    The algorithms' progress output goes to the null device for the
+    worker's whole lifetime rather than being buffered.
+    """
+    sys.stdout = open(os.devnull, 'w')
+
+
+def run_job(pattern, kind, output_dir="test_outputs", output_svg=None):
+    """
+    Run one algorithm variant on one test pattern.
+
+    Runs inside a pool worker, so a crash or exception in one algorithm
+    only fails this job.
+
+    Args:
+        pattern: Path to input test pattern
+        kind: "original" or a Retinex dithering method
+        output_dir: Directory for output files
+        output_svg: Precomputed output SVG path
+
+    Returns:
+        Tuple of (preview path for the comparison, elapsed seconds)
+    """
+    start_time = time.time()
+    if kind == "original":
+        _, preview = run_original_algorithm(pattern, output_dir, output_svg)
+    else:
+        _, preview = run_retinex_algorithm(pattern, output_dir, kind, output_svg)
+    return preview, time.time() - start_time
+
+
+# Column labels, in JOB_KINDS order
+LABELS = ["Original (nearest color)", "Retinex + Floyd-Steinberg", "Retinex + Atkinson"]
+LABEL_COLOR = (230, 230, 230, 255)
+
+# Load the label font once per process rather than once per comparison
+try:
+    _LABEL_FONT = ImageFont.truetype("DejaVuSans.ttf", 22)
+except OSError:
+    _LABEL_FONT = ImageFont.load_default()
+
+
+def _render_label(label):
+    """
+    Rasterize a label to an RGBA bitmap cropped horizontally to the text.
+
+    Every label shares the same height and baseline, so they line up when
+    pasted side by side.
+
+    Args:
+        label: Label text
+
+    Returns:
+        RGBA image of the text on a transparent background
+    """
+    left, _, right, _ = _LABEL_FONT.getbbox(label)
+    height = _LABEL_FONT.getbbox("".join(LABELS))[3]
+    img = Image.new('RGBA', (max(1, right - left), height), (0, 0, 0, 0))
+    ImageDraw.Draw(img).text((-left, 0), label, font=_LABEL_FONT, fill=LABEL_COLOR)
+    return img
+
+
+# The labels never change, so render each one once and paste the bitmap
+_LABEL_IMAGES = {label: _render_label(label) for label in LABELS}
+
+
+def load_panel(path, size=None):
+    """
+    Load one comparison panel as a fully decoded RGB image.
+
+    Args:
+        path: Path to the image
+        size: Optional (width, height) to scale the panel to
+
+    Returns:
+        RGB image, or None if the file doesn't exist
+    """
+    if not os.path.exists(path):
+        return None
+
+    with Image.open(path) as img:
+        if size:
+            # Let the decoder skip detail the resize would throw away (JPEG only)
+            img.draft('RGB', size)
+        img = img.convert('RGB')
+
+    if size and img.size != size:
+        img = img.resize(size, Image.Resampling.LANCZOS)
+    return img
+
+
 def create_comparison_image(original_path, retinex_fs_path, retinex_atk_path, output_path):
     """
     Create a side-by-side comparison image with labels.
@@ -108,43 +456,114 @@ def create_comparison_image(original_path, retinex_fs_path, retinex_atk_path, ou
         retinex_atk_path: Path to Retinex Atkinson preview
         output_path: Path for output comparison image
     """
-    # Load preview images (they're created by the Retinex script)
-    # For original, we need to render from the input since it doesn't create preview
-    img_original = Image.open(original_path) if os.path.exists(original_path) else None
-    img_retinex_fs = Image.open(retinex_fs_path) if os.path.exists(retinex_fs_path) else None
-    img_retinex_atk = Image.open(retinex_atk_path) if os.path.exists(retinex_atk_path) else None
-
-    if not img_retinex_fs:
+    if not os.path.exists(retinex_fs_path):
         return  # Skip if no Retinex output
 
+    # Only the header is read here; panels are decoded one at a time below
+    with Image.open(retinex_fs_path) as probe:
+        img_width, img_height = probe.size
+
     # Create comparison layout
     margin = 20
     label_height = 40
-    img_height = img_retinex_fs.height
-    img_width = img_retinex_fs.width
 
     # Three columns: original, Floyd-Steinberg, Atkinson
     total_width = 3 * img_width + 4 * margin
     total_height = img_height + label_height + 2 * margin
 
-    comparison = Image.new('RGB', (total_width, total_height), color=(50, 50, 50))
-    draw = ImageDraw.Draw(comparison)
+    # Preallocated canvas: each panel is a straight slice copy
+    comparison = np.full((total_height, total_width, 3), 50, dtype=np.uint8)
+    top = margin + label_height
 
     # Column positions
     col_x = [margin, margin + img_width + margin, margin + 2 * (img_width + margin)]
-    labels = ["Original (nearest color)", "Retinex + Floyd-Steinberg", "Retinex + Atkinson"]
 
-    # Paste images and add labels
-    images = [img_original, img_retinex_fs, img_retinex_atk]
-    for idx, (x, label, img) in enumerate(zip(col_x, labels, images)):
+    # Paste images, scaling each to the Floyd-Steinberg preview so the columns
+    # line up; a missing panel is never decoded
+    paths = [original_path, retinex_fs_path, retinex_atk_path]
+    for x, path in zip(col_x, paths):
+        img = load_panel(path, (img_width, img_height))
         if img:
-            comparison.paste(img, (x, margin + label_height))
+            comparison[top:top + img_height, x:x + img_width] = np.asarray(img)
 
-        # Draw label (simple text - no font needed for basic version)
+    comparison = Image.fromarray(comparison)
+
+    # Add labels, centered over each column within the label band
+    for x, label in zip(col_x, LABELS):
+        label_img = _LABEL_IMAGES[label]
         text_x = x + img_width // 2
-        # Could add text here if font is available
+        text_y = margin + (label_height - label_img.height) // 2
+        comparison.paste(label_img, (text_x - label_img.width // 2, text_y), label_img)
+
+    # Comparisons are only viewed, so trade file size for a much faster encode
+    comparison.save(output_path, format='PNG', compress_level=1, optimize=False)
+
+
+# Sidecar in the comparison directory holding the last run's per-pattern timings
+TIMINGS_FILE = ".timings.json"
+
+
+def pattern_is_fresh(pattern, output_dir, comparison_path):
+    """
+    Check whether every output for a pattern is newer than its sources.
+
+    Args:
+        pattern: Path to input test pattern
+        output_dir: Directory for algorithm outputs
+        comparison_path: Path of the pattern's comparison image
 
-    comparison.save(output_path)
+    Returns:
+        True if no algorithm run or comparison is needed
+    """
+    basename = Path(pattern).stem
+    for kind in JOB_KINDS:
+        output_svg = output_svg_path(output_dir, basename, kind)
+        preview_path = preview_path_for(output_svg)
+        module = color_to_squares if kind == "original" else color_to_squares_retinex
+        if not is_up_to_date([output_svg, preview_path], pattern, module):
+            return False
+    return is_up_to_date([comparison_path], pattern, sys.modules[__name__])
+
+
+def load_cached_timings(comparison_dir):
+    """
+    Load the per-pattern timings recorded by the previous run.
+
+    Args:
+        comparison_dir: Directory for comparison images
+
+    Returns:
+        Dictionary of pattern name -> seconds (empty if there is no record)
+    """
+    try:
+        with open(Path(comparison_dir) / TIMINGS_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def assemble_comparison(pattern_previews, comparison_path):
+    """
+    Build one pattern's comparison image from its finished jobs.
+
+    Args:
+        pattern_previews: Dictionary of job kind -> preview path (or the
+            exception the job raised)
+        comparison_path: Path for output comparison image
+
+    Returns:
+        Elapsed seconds
+    """
+    for preview in pattern_previews.values():
+        if isinstance(preview, Exception):
+            raise preview
+
+    start_time = time.time()
+    create_comparison_image(
+        *(pattern_previews[kind] for kind in JOB_KINDS),
+        comparison_path
+    )
+    return time.time() - start_time
 
 
 def process_all_test_patterns(test_dir="test_patterns", output_dir="test_outputs", comparison_dir="comparison_results"):
@@ -170,8 +589,6 @@ def process_all_test_patterns(test_dir="test_patterns", output_dir="test_outputs
         print("❌ No test patterns found!")
         return {}
 
-    print(f"🔬 Processing {len(patterns)} test patterns...\n")
-
     results = {
         'total': len(patterns),
         'processed': 0,
@@ -179,48 +596,93 @@ def process_all_test_patterns(test_dir="test_patterns", output_dir="test_outputs
         'timings': {}
     }
 
-    for idx, pattern in enumerate(patterns, 1):
-        basename = Path(pattern).stem
-        print(f"[{idx}/{len(patterns)}] Processing: {basename}")
-
-        try:
-            start_time = time.time()
-
-            # Run original algorithm
-            print(f"  → Running original algorithm...")
-            original_svg = run_original_algorithm(pattern, output_dir)
-
-            # Run Retinex with Floyd-Steinberg
-            print(f"  → Running Retinex + Floyd-Steinberg...")
-            retinex_fs_svg, retinex_fs_preview = run_retinex_algorithm(
-                pattern, output_dir, "floyd-steinberg"
-            )
-
-            # Run Retinex with Atkinson
-            print(f"  → Running Retinex + Atkinson...")
-            retinex_atk_svg, retinex_atk_preview = run_retinex_algorithm(
-                pattern, output_dir, "atkinson"
-            )
-
-            # Create comparison image
-            print(f"  → Creating comparison image...")
-            comparison_path = os.path.join(comparison_dir, f"{basename}_comparison.png")
-            create_comparison_image(
-                pattern,  # Use original test pattern for comparison
-                retinex_fs_preview,
-                retinex_atk_preview,
-                comparison_path
-            )
-
-            elapsed = time.time() - start_time
-            results['timings'][basename] = elapsed
+    # Patterns whose outputs are all fresh keep their timings from last run
+    basenames = {pattern: Path(pattern).stem for pattern in patterns}
+    cached_timings = load_cached_timings(comparison_dir)
+    needed = []
+    for pattern in patterns:
+        basename = basenames[pattern]
+        comparison_path = Path(comparison_dir) / f"{basename}_comparison.png"
+        if basename in cached_timings and pattern_is_fresh(pattern, output_dir, comparison_path):
+            results['timings'][basename] = cached_timings[basename]
             results['processed'] += 1
-
-            print(f"  ✓ Complete ({elapsed:.2f}s)\n")
-
-        except Exception as e:
-            print(f"  ✗ Failed: {e}\n")
-            results['failed'] += 1
+        else:
+            needed.append(pattern)
+
+    if not needed:
+        print("✨ All outputs are up to date - nothing to do.")
+        return results
+
+    print(f"🔬 Processing {len(needed)} of {len(patterns)} test patterns...\n")
+
+    workers = max(1, os.cpu_count() or 1)
+    previews = {pattern: {} for pattern in patterns}
+    job_times = {pattern: 0.0 for pattern in patterns}
+
+    # A persistent pool of pre-imported workers keeps every core busy;
+    # comparisons are assembled on threads in the meantime, so the parent
+    # never stops collecting finished jobs to decode, paste and encode PNGs.
+    # Workers are spawned rather than forked from this threaded parent.
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker
+    )
+    with pool as executor, ThreadPoolExecutor(max_workers=workers) as assembler:
+        jobs = {
+            executor.submit(
+                run_job, pattern, kind, output_dir,
+                output_svg_path(output_dir, basenames[pattern], kind)
+            ): (pattern, kind)
+            for pattern in needed
+            for kind in JOB_KINDS
+        }
+        comparisons = {}
+        pending = set(jobs)
+        idx = 0
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in jobs:
+                    pattern, kind = jobs[future]
+                    try:
+                        previews[pattern][kind], elapsed = future.result()
+                        job_times[pattern] += elapsed
+                    except Exception as e:
+                        previews[pattern][kind] = e
+
+                    if len(previews[pattern]) < len(JOB_KINDS):
+                        continue
+
+                    # Start the comparison as soon as the pattern's last job finishes
+                    comparison_path = Path(comparison_dir) / f"{basenames[pattern]}_comparison.png"
+                    comparison = assembler.submit(
+                        assemble_comparison, previews[pattern], comparison_path
+                    )
+                    comparisons[comparison] = pattern
+                    pending.add(comparison)
+                    continue
+
+                pattern = comparisons[future]
+                basename = basenames[pattern]
+                idx += 1
+                print(f"[{idx}/{len(needed)}] Processing: {basename}")
+
+                try:
+                    elapsed = job_times[pattern] + future.result()
+
+                    results['timings'][basename] = elapsed
+                    results['processed'] += 1
+
+                    print(f"  ✓ Complete ({elapsed:.2f}s)\n")
+
+                except Exception as e:
+                    print(f"  ✗ Failed: {e}\n")
+                    results['failed'] += 1
+
+    with open(Path(comparison_dir) / TIMINGS_FILE, 'w') as f:
+        json.dump(results['timings'], f, indent=2, sort_keys=True)
 
     return results
 
@@ -233,58 +695,63 @@ def generate_summary_report(results, output_file="test_report.txt"):
         results: Dictionary with processing statistics
         output_file: Path to output report file
     """
+    parts = []
+    parts.append("=" * 70 + "\n")
+    parts.append("MOPA LASER COLOR REPRODUCTION - COMPARISON TEST REPORT\n")
+    parts.append("=" * 70 + "\n\n")
+
+    parts.append(f"Total test patterns: {results['total']}\n")
+    parts.append(f"Successfully processed: {results['processed']}\n")
+    parts.append(f"Failed: {results['failed']}\n\n")
+
+    if results['timings']:
+        parts.append("Processing times:\n")
+        parts.append("-" * 70 + "\n")
+        parts.append("\n".join(
+            f"  {name:50s} {elapsed:6.2f}s"
+            for name, elapsed in sorted(results['timings'].items())
+        ) + "\n")
+
+        avg_time = sum(results['timings'].values()) / len(results['timings'])
+        parts.append("-" * 70 + "\n")
+        parts.append(f"  Average processing time: {avg_time:.2f}s\n\n")
+
+    parts.append("\n" + "=" * 70 + "\n")
+    parts.append("HOW TO EVALUATE THE RESULTS\n")
+    parts.append("=" * 70 + "\n\n")
+
+    parts.append("1. VIEW COMPARISON IMAGES:\n")
+    parts.append("   - Look in 'comparison_results/' directory\n")
+    parts.append("   - Each image shows three versions side-by-side:\n")
+    parts.append("     * Original algorithm (nearest color matching)\n")
+    parts.append("     * Retinex + Floyd-Steinberg dithering\n")
+    parts.append("     * Retinex + Atkinson dithering\n\n")
+
+    parts.append("2. WHAT TO LOOK FOR:\n")
+    parts.append("   - Gradient smoothness (less banding)\n")
+    parts.append("   - Intermediate color reproduction\n")
+    parts.append("   - Detail preservation\n")
+    parts.append("   - Color accuracy in patches\n\n")
+
+    parts.append("3. LOAD SVG FILES INTO LIGHTBURN:\n")
+    parts.append("   - SVG files are in 'test_outputs/' directory\n")
+    parts.append("   - Files ending in '_original.svg': Original algorithm\n")
+    parts.append("   - Files ending in '_retinex_floyd-steinberg.svg': Retinex + FS\n")
+    parts.append("   - Files ending in '_retinex_atkinson.svg': Retinex + Atkinson\n\n")
+
+    parts.append("4. ENGRAVE AND COMPARE:\n")
+    parts.append("   - Pick a few representative test patterns\n")
+    parts.append("   - Engrave the same pattern with all three algorithms\n")
+    parts.append("   - Compare the physical results\n\n")
+
+    parts.append("RECOMMENDATIONS:\n")
+    parts.append("  - Start with 'smooth_gradients.png' to see banding reduction\n")
+    parts.append("  - Try 'hsv_colorspace.png' to see gamut expansion\n")
+    parts.append("  - Use 'color_patches.png' for discrete color accuracy\n")
+    parts.append("  - Test 'skin_tones.png' if you do portrait work\n\n")
+
     with open(output_file, 'w') as f:
-        f.write("=" * 70 + "\n")
-        f.write("MOPA LASER COLOR REPRODUCTION - COMPARISON TEST REPORT\n")
-        f.write("=" * 70 + "\n\n")
-
-        f.write(f"Total test patterns: {results['total']}\n")
-        f.write(f"Successfully processed: {results['processed']}\n")
-        f.write(f"Failed: {results['failed']}\n\n")
-
-        if results['timings']:
-            f.write("Processing times:\n")
-            f.write("-" * 70 + "\n")
-            for name, elapsed in sorted(results['timings'].items()):
-                f.write(f"  {name:50s} {elapsed:6.2f}s\n")
-
-            avg_time = sum(results['timings'].values()) / len(results['timings'])
-            f.write("-" * 70 + "\n")
-            f.write(f"  Average processing time: {avg_time:.2f}s\n\n")
-
-        f.write("\n" + "=" * 70 + "\n")
-        f.write("HOW TO EVALUATE THE RESULTS\n")
-        f.write("=" * 70 + "\n\n")
-
-        f.write("1. VIEW COMPARISON IMAGES:\n")
-        f.write("   - Look in 'comparison_results/' directory\n")
-        f.write("   - Each image shows three versions side-by-side:\n")
-        f.write("     * Original algorithm (nearest color matching)\n")
-        f.write("     * Retinex + Floyd-Steinberg dithering\n")
-        f.write("     * Retinex + Atkinson dithering\n\n")
-
-        f.write("2. WHAT TO LOOK FOR:\n")
-        f.write("   - Gradient smoothness (less banding)\n")
-        f.write("   - Intermediate color reproduction\n")
-        f.write("   - Detail preservation\n")
-        f.write("   - Color accuracy in patches\n\n")
-
-        f.write("3. LOAD SVG FILES INTO LIGHTBURN:\n")
-        f.write("   - SVG files are in 'test_outputs/' directory\n")
-        f.write("   - Files ending in '_original.svg': Original algorithm\n")
-        f.write("   - Files ending in '_retinex_floyd-steinberg.svg': Retinex + FS\n")
-        f.write("   - Files ending in '_retinex_atkinson.svg': Retinex + Atkinson\n\n")
-
-        f.write("4. ENGRAVE AND COMPARE:\n")
-        f.write("   - Pick a few representative test patterns\n")
-        f.write("   - Engrave the same pattern with all three algorithms\n")
-        f.write("   - Compare the physical results\n\n")
-
-        f.write("RECOMMENDATIONS:\n")
-        f.write("  - Start with 'smooth_gradients.png' to see banding reduction\n")
-        f.write("  - Try 'hsv_colorspace.png' to see gamut expansion\n")
-        f.write("  - Use 'color_patches.png' for discrete color accuracy\n")
-        f.write("  - Test 'skin_tones.png' if you do portrait work\n\n")
+        f.write("".join(parts))
 
 
 def main():
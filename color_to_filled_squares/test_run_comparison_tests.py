@@ -0,0 +1,87 @@
+"""
+Tests for the comparison runner's output checks and stamps.
+
+Run from the color_to_filled_squares directory with:
+    python -m unittest test_run_comparison_tests
+"""
+
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+import run_comparison_tests as runner
+
+
+class TruncatedPatternTest(unittest.TestCase):
+    """A pattern the algorithms can't decode must fail without being stamped."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+
+        # Keep the content cache out of the working directory
+        cache_dir = runner.CACHE_DIR
+        runner.CACHE_DIR = self.dir / ".cache"
+        self.addCleanup(setattr, runner, "CACHE_DIR", cache_dir)
+
+        # First 300 bytes of a valid PNG: the header parses, the pixel data doesn't
+        self.pattern = self.dir / "truncated.png"
+        with open(Path(__file__).with_name("tiny.png"), 'rb') as f:
+            self.pattern.write_bytes(f.read()[:300])
+
+    def assert_not_stamped(self):
+        self.assertEqual(list(self.dir.glob("*.stamp")), [])
+        self.assertFalse(runner.CACHE_DIR.exists() and any(runner.CACHE_DIR.iterdir()))
+
+    def test_original_algorithm(self):
+        with self.assertRaises(RuntimeError):
+            runner.run_original_algorithm(str(self.pattern), str(self.dir))
+        self.assert_not_stamped()
+
+    def test_retinex_algorithm(self):
+        with self.assertRaises(RuntimeError):
+            runner.run_retinex_algorithm(str(self.pattern), str(self.dir), "floyd-steinberg")
+        self.assert_not_stamped()
+
+    def test_write_stamp_requires_outputs(self):
+        output_svg = self.dir / "missing.svg"
+        with self.assertRaises(RuntimeError):
+            runner.write_stamp("key", [output_svg, runner.preview_path_for(output_svg)])
+        self.assert_not_stamped()
+
+
+class StampTest(unittest.TestCase):
+    """A stamp must stop matching once the algorithm's code changes."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+
+        self.pattern = self.dir / "pattern.png"
+        self.pattern.write_bytes(b"pattern")
+        self.source = self.dir / "algorithm.py"
+        self.source.write_text("ALGORITHM_VERSION = 1\n")
+        self.module = types.SimpleNamespace(__file__=str(self.source), ALGORITHM_VERSION=1)
+
+        self.outputs = [self.dir / "pattern.svg", self.dir / "pattern_preview.png"]
+        for path in self.outputs:
+            path.write_bytes(b"output")
+
+    def key(self):
+        return runner.cache_key(self.pattern, "retinex", self.module, 0.25, "atkinson")
+
+    def test_unchanged_source_matches(self):
+        runner.write_stamp(self.key(), self.outputs)
+        self.assertTrue(runner.stamp_matches(self.key(), self.outputs))
+
+    def test_edited_source_does_not_match(self):
+        runner.write_stamp(self.key(), self.outputs)
+        self.source.write_text("ALGORITHM_VERSION = 1\n# edited\n")
+        self.assertFalse(runner.stamp_matches(self.key(), self.outputs))
+
+
+if __name__ == "__main__":
+    unittest.main()